@@ -0,0 +1,130 @@
+// Tooltips, click-to-select and the vector-only toggle for the
+// towns-over-Champlain mashup map
+
+// Track selected features as a simple object: { "hydroid": "name" }
+const selectedFeatures = {};
+
+// The page's map, set by initMashupMap(), and whether it is drawn vector-only
+let mashupMap = null;
+let vectorOnly = false;
+
+// A feature's unselected style: its group's folium style, with black
+// outlines and slightly stronger fills in vector-only mode
+function baseStyle(group, featureLayer) {
+    const style = Object.assign({}, group.options.style(featureLayer.feature));
+    if (vectorOnly) {
+        style.color = '#000000';
+        style.fillOpacity = Math.min(1, (style.fillOpacity || 0) + 0.1);
+    }
+    return style;
+}
+
+// Switch between the OpenStreetMap view and the vector-only view, which
+// hides the basemap tiles and restyles every unselected feature
+function toggleVectorOnly() {
+    vectorOnly = !vectorOnly;
+    document.body.classList.toggle('vector-only', vectorOnly);
+    mashupMap.eachLayer(function(group) {
+        if (group instanceof L.GeoJSON) {
+            group.eachLayer(function(featureLayer) {
+                if (!selectedFeatures[featureLayer.feature.properties.HYDROID]) {
+                    featureLayer.setStyle(baseStyle(group, featureLayer));
+                }
+            });
+        }
+    });
+}
+
+// Function to update JSON display
+function updateJSONDisplay() {
+    const jsonOutput = document.getElementById('json-output');
+    if (Object.keys(selectedFeatures).length === 0) {
+        jsonOutput.textContent = '{}';
+    } else {
+        jsonOutput.textContent = JSON.stringify(selectedFeatures, null, 2);
+    }
+}
+
+// Toggle a water feature's selection
+function onFeatureClick(e) {
+    L.DomEvent.stopPropagation(e);
+
+    // The group's handler sees itself as target and the clicked feature
+    // as propagatedFrom
+    const featureLayer = e.propagatedFrom;
+    if (!featureLayer || !featureLayer.feature || !featureLayer.feature.properties) return;
+
+    const props = featureLayer.feature.properties;
+    const hydroid = props.HYDROID;
+    const name = props.FULLNAME || props.NAME || 'Unnamed';
+
+    // Skip if no HYDROID (probably a town layer)
+    if (!hydroid) {
+        console.log('Clicked non-water feature:', name);
+        return;
+    }
+
+    console.log('Clicked water feature:', name, hydroid);
+
+    // Check if already selected
+    if (selectedFeatures[hydroid]) {
+        // Deselect - remove from object and reset color
+        console.log('Deselecting:', name);
+        delete selectedFeatures[hydroid];
+        featureLayer.setStyle(baseStyle(e.target, featureLayer));
+    } else {
+        // Select - add to object and make pink
+        console.log('Selecting:', name);
+        featureLayer.setStyle({
+            fillColor: '#ff1493',  // Deep pink
+            fillOpacity: 0.8,
+            color: '#c90076',
+            weight: 2
+        });
+
+        selectedFeatures[hydroid] = name;
+    }
+
+    updateJSONDisplay();
+}
+
+// Add one delegated click handler per GeoJSON layer group; feature clicks
+// propagate up to it. The generated page calls this with its folium map
+// variable once all of its layers have been added
+function initMashupMap(mapObj) {
+    mashupMap = mapObj;
+    mapObj.whenReady(function() {
+        console.log('Setting up click handlers...');
+        let groupCount = 0;
+
+        mapObj.eachLayer(function(layer) {
+            if (layer instanceof L.GeoJSON) {
+                layer.on('click', onFeatureClick);
+                // Features stream in after the page loads; restyle any that
+                // arrive while the vector-only view is on
+                layer.on('layeradd', function(e) {
+                    if (vectorOnly) e.layer.setStyle(baseStyle(layer, e.layer));
+                });
+                groupCount++;
+            }
+        });
+
+        console.log('Click handlers attached to', groupCount, 'GeoJSON layer groups');
+    });
+}
+
+// Tooltip content for a GeoJSON layer group: a table of the hovered feature's
+// fields under their aliases. Bound once per group, so one tooltip serves
+// every feature in it
+function mashupTooltip(fields, aliases) {
+    return function(layer) {
+        const props = layer.feature.properties;
+        const rows = fields.map(function(field, i) {
+            let value = props[field];
+            if (value == null) value = '';
+            else if (typeof value === 'number') value = value.toLocaleString();
+            return '<tr><th style="text-align: left;">' + aliases[i] + '</th><td>' + value + '</td></tr>';
+        });
+        return '<table>' + rows.join('') + '</table>';
+    };
+}
@@ -5,31 +5,369 @@ Using 2022 Census data (2023 URLs are not yet fully available)
 
 import folium
 import geopandas as gpd
+import gzip
+import hashlib
+import multiprocessing
+import numpy as np
+import orjson
+import os
+import shapely
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from folium.template import Template as FoliumTemplate
+from functools import lru_cache
 from pathlib import Path
+from pyproj import CRS, Transformer
 import sys
 
+# Brotli sidecars are written only when the brotli package is installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# TIGER/Line sources shared by the map builders
+AREAWATER_URL = "https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_50_areawater.zip"
+LINEARWATER_URL = "https://www2.census.gov/geo/tiger/TIGER2022/LINEARWATER/tl_2022_50_linearwater.zip"
+STATE_URL = "https://www2.census.gov/geo/tiger/TIGER2023/STATE/tl_2023_us_state.zip"
+COUNTY_URL = "https://www2.census.gov/geo/tiger/TIGER2023/COUNTY/tl_2023_us_county.zip"
+VT_FIPS = '50'
+
+WGS84 = CRS.from_epsg(4326)
+
+# Attribute columns referenced by each layer's tooltip; everything else is
+# dropped before folium embeds the features in the HTML
+WATER_COLUMNS = ['FULLNAME', 'MTFCC', 'area_sqkm']
+LINEAR_WATER_COLUMNS = ['FULLNAME']
+COUNTY_COLUMNS = ['NAME']
+STATE_COLUMNS = []
+
+# Tooltip labels for the attribute columns above
+TOOLTIP_ALIASES = {
+    'FULLNAME': 'Name:',
+    'MTFCC': 'Type:',
+    'NAME': 'Name:',
+}
+
+# GeoJSON type names for the geometry types produced by shapely.to_ragged_array
+GEOJSON_TYPES = {
+    shapely.GeometryType.POINT: 'Point',
+    shapely.GeometryType.LINESTRING: 'LineString',
+    shapely.GeometryType.POLYGON: 'Polygon',
+    shapely.GeometryType.MULTIPOINT: 'MultiPoint',
+    shapely.GeometryType.MULTILINESTRING: 'MultiLineString',
+    shapely.GeometryType.MULTIPOLYGON: 'MultiPolygon',
+}
+
+# Layer styles, shared by reference so style_function allocates nothing
+# per feature
+WATER_STYLE = {
+    'fillColor': '#4a90e2',
+    'color': '#2e5f8a',
+    'weight': 1,
+    'fillOpacity': 0.7
+}
+
+RIVER_STYLE = {
+    'color': '#3498db',
+    'weight': 2,
+    'opacity': 0.7
+}
+
+STATE_OUTLINE_STYLE = {
+    'fillColor': 'transparent',
+    'color': '#2c5f2d',
+    'weight': 2,
+    'fillOpacity': 0
+}
+
+LAKE_STYLE = {
+    'fillColor': '#1e88e5',
+    'color': '#0d47a1',
+    'weight': 1,
+    'fillOpacity': 0.8
+}
+
+STATE_FILL_STYLE = {
+    'fillColor': '#e8f5e9',
+    'color': '#2c5f2d',
+    'weight': 3,
+    'fillOpacity': 0.2
+}
+
+COUNTY_STYLE = {
+    'fillColor': 'transparent',
+    'color': '#666',
+    'weight': 1,
+    'dashArray': '5, 5',
+    'fillOpacity': 0
+}
+
+
+def keep_columns(gdf: gpd.GeoDataFrame, columns: list) -> gpd.GeoDataFrame:
+    """
+    Project a GeoDataFrame down to geometry plus the given attribute columns
+    """
+    return gdf[[c for c in columns if c in gdf.columns] + ['geometry']]
 
-def create_water_areas_map(output_path: str = 'output/vermont_water_areas.html'):
+
+def tooltip_fields(gdf: gpd.GeoDataFrame, fields: tuple) -> tuple:
     """
-    Water areas including Lake Champlain - this should show islands!
+    Return the (fields, aliases) lists for the tooltip fields present in gdf
+    """
+    columns = set(gdf.columns)
+    present = [f for f in fields if f in columns]
+    return present, [TOOLTIP_ALIASES[f] for f in present]
+
+
+def fast_geojson(gdf: gpd.GeoDataFrame) -> dict:
+    """
+    Build a GeoJSON FeatureCollection from a GeoDataFrame in bulk
+
+    Geometries are flattened once with shapely.to_ragged_array and the
+    coordinate arrays are sliced back into nested lists with NumPy, instead
+    of going through __geo_interface__ one geometry at a time. Mixed
+    single/multi part layers come back as their multi-part type. Missing
+    or empty geometries become null, and layers to_ragged_array cannot
+    flatten (mixed types, collections) fall back to shapely's mapping().
+    """
+    if len(gdf) == 0:
+        return {'type': 'FeatureCollection', 'features': []}
+
+    geoms = np.asarray(gdf.geometry.values)
+    present = np.flatnonzero(~(shapely.is_missing(geoms) | shapely.is_empty(geoms)))
+    geometries = [None] * len(gdf)
+    try:
+        geometry_type, coords, offsets = shapely.to_ragged_array(geoms[present], include_z=False)
+    except ValueError:
+        for i in present:
+            geometries[i] = shapely.geometry.mapping(geoms[i])
+    else:
+        # Split the flat coordinate array at the innermost offsets, then
+        # group the parts level by level up to one entry per geometry
+        if offsets:
+            parts = [c.tolist() for c in np.split(coords, offsets[0][1:-1])]
+            for level in offsets[1:]:
+                parts = [parts[a:b] for a, b in zip(level[:-1], level[1:])]
+        else:
+            parts = coords.tolist()
+
+        geojson_type = GEOJSON_TYPES[geometry_type]
+        for i, part in zip(present, parts):
+            geometries[i] = {'type': geojson_type, 'coordinates': part}
+
+    # to_dict('records') yields no rows at all for a frame without columns
+    props = gdf.drop(columns=gdf.geometry.name)
+    if len(props.columns):
+        props = props.astype(object).where(props.notna(), None).to_dict('records')
+    else:
+        props = [{}] * len(gdf)
+
+    return {
+        'type': 'FeatureCollection',
+        'features': [
+            {
+                'id': str(idx),
+                'type': 'Feature',
+                'properties': prop,
+                'geometry': geometry
+            }
+            for idx, prop, geometry in zip(gdf.index, props, geometries)
+        ]
+    }
+
+
+@dataclass
+class TigerDatasets:
+    """
+    TIGER/Line frames loaded once and shared by every map builder
+    """
+    water: gpd.GeoDataFrame
+    linear_water: gpd.GeoDataFrame
+    states: gpd.GeoDataFrame
+    counties: gpd.GeoDataFrame
+    vt_state: gpd.GeoDataFrame
+    vt_counties: gpd.GeoDataFrame
+
+
+@lru_cache(maxsize=None)
+def get_transformer(src: CRS, dst: CRS) -> Transformer:
+    """
+    Build (once per CRS pair) an always_xy Transformer
+    """
+    return Transformer.from_crs(src, dst, always_xy=True)
+
+
+def bulk_to_crs(gdf: gpd.GeoDataFrame, dst: CRS = WGS84,
+                max_workers: int = None) -> gpd.GeoDataFrame:
+    """
+    Reproject a GeoDataFrame by transforming coordinate arrays in bulk
+
+    The geometry array is split into chunks and each chunk's coordinates are
+    pushed through one shared Transformer as NumPy arrays on a thread pool.
+    """
+    if gdf.crs is None or gdf.crs == dst:
+        return gdf
+
+    transformer = get_transformer(gdf.crs, dst)
+
+    def reproject(coords):
+        return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
+
+    geoms = np.asarray(gdf.geometry.values)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(geoms)))
+    chunks = np.array_split(geoms, workers)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(lambda chunk: shapely.transform(chunk, reproject), chunks))
+
+    reprojected = np.concatenate(parts) if parts else geoms
+    return gdf.set_geometry(gpd.GeoSeries(reprojected, index=gdf.index, crs=dst))
+
+
+def to_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Reproject to EPSG:4326 if the frame is not already in it
+    """
+    return bulk_to_crs(gdf, WGS84)
+
+
+def build_key(*paths) -> str:
+    """
+    Cache key for a build from its input files' paths, sizes and mtimes
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        st = Path(path).stat()
+        digest.update(f"{path}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def is_current(key: str, *outputs) -> bool:
+    """
+    True if every output exists and the first was last built with this key
+
+    The key is stored next to the first output as <output>.key by
+    write_key(), so unchanged inputs skip the rebuild entirely.
+    """
+    marker = Path(f"{outputs[0]}.key")
+    return (all(Path(output).exists() for output in outputs)
+            and marker.exists() and marker.read_text() == key)
+
+
+def write_key(key: str, output) -> None:
+    """
+    Record the build key an output was generated from
+    """
+    Path(f"{output}.key").write_text(key)
+
+
+def orjson_dumps(obj, sort_keys: bool = False, **kwargs) -> str:
+    """
+    json.dumps stand-in for Jinja's tojson filter, encoding with orjson
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return orjson.dumps(obj, option=option).decode()
+
+
+def use_orjson_for_folium() -> None:
+    """
+    Make folium's tojson filter, which embeds every GeoJson layer's
+    features, encode with orjson_dumps instead of the stdlib
+
+    The Jinja environment is shared by every folium map in the process,
+    so builders call this when they run rather than at import.
+    """
+    FoliumTemplate('').environment.policies['json.dumps_function'] = orjson_dumps
+
+
+def write_compressed(path, data) -> Path:
+    """
+    Write data to path plus pre-compressed .gz (and .br) siblings
+
+    data is bytes or an iterable of bytes chunks; chunks are written and
+    compressed as they come, so a large page never has to be joined into
+    one buffer. Static hosts that honour pre-compressed assets can serve a
+    sibling with a matching Content-Encoding instead of compressing on
+    every request. Each file goes through a per-process temporary file,
+    so parallel builders writing the same output never leave a
+    half-written copy.
+    """
+    if isinstance(data, bytes):
+        data = (data,)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    targets = [path, Path(f"{path}.gz")]
+    compressor = None
+    if brotli is not None:
+        targets.append(Path(f"{path}.br"))
+        compressor = brotli.Compressor(quality=11)
+    tmps = [target.with_name(f"{target.name}.{os.getpid()}.tmp") for target in targets]
+
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(tmp, 'wb')) for tmp in tmps]
+        gz = stack.enter_context(gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=files[1]))
+        for chunk in data:
+            files[0].write(chunk)
+            gz.write(chunk)
+            if compressor:
+                files[2].write(compressor.process(chunk))
+        if compressor:
+            files[2].write(compressor.finish())
+
+    for tmp, target in zip(tmps, targets):
+        os.replace(tmp, target)
+    return path
+
+
+def load_datasets() -> TigerDatasets:
+    """
+    Download each TIGER dataset once, reproject, and derive the VT subsets
     """
     print("\n" + "=" * 60)
-    print("Creating Vermont Water Areas Map")
+    print("Loading TIGER/Line datasets")
     print("=" * 60)
 
-    try:
-        print("  Downloading water areas data (2022)...")
-        url = "https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_50_areawater.zip"
-        water = gpd.read_file(url)
+    print("  Downloading water areas data (2022)...")
+    water = to_wgs84(gpd.read_file(AREAWATER_URL))
+    print(f"  Found {len(water)} water features")
+
+    # Calculate area for filtering
+    water['area_sqkm'] = water.geometry.area * 111 * 111
+
+    print("  Downloading linear water features (2022)...")
+    linear_water = to_wgs84(gpd.read_file(LINEARWATER_URL))
+    print(f"  Found {len(linear_water)} linear water features")
 
-        if water.crs != 'EPSG:4326':
-            water = water.to_crs('EPSG:4326')
+    print("  Downloading state boundaries...")
+    states = gpd.read_file(STATE_URL)
+    vt_state = to_wgs84(states[states['STATEFP'] == VT_FIPS].copy())
 
-        print(f"  Found {len(water)} water features")
+    print("  Downloading counties...")
+    counties = gpd.read_file(COUNTY_URL)
+    vt_counties = to_wgs84(counties[counties['STATEFP'] == VT_FIPS].copy())
 
-        # Calculate area for filtering
-        water['area_sqkm'] = water.geometry.area * 111 * 111
+    return TigerDatasets(
+        water=water,
+        linear_water=linear_water,
+        states=states,
+        counties=counties,
+        vt_state=vt_state,
+        vt_counties=vt_counties
+    )
 
+
+def create_water_areas_map(water: gpd.GeoDataFrame,
+                           output_path: str = 'output/vermont_water_areas.html'):
+    """
+    Water areas including Lake Champlain - this should show islands!
+    """
+    print("\n" + "=" * 60)
+    print("Creating Vermont Water Areas Map")
+    print("=" * 60)
+
+    try:
         # Show all significant water
         large_water = water[water['area_sqkm'] > 0.05].copy()
         print(f"  Showing {len(large_water)} water bodies > 0.05 sq km")
@@ -41,20 +379,15 @@ def create_water_areas_map(output_path: str = 'output/vermont_water_areas.html')
             tiles='OpenStreetMap'
         )
 
+        large_water = keep_columns(large_water, WATER_COLUMNS)
+        fields, aliases = tooltip_fields(large_water, ('FULLNAME', 'MTFCC'))
+
         # Add water bodies
         folium.GeoJson(
-            large_water,
+            fast_geojson(large_water),
             name='Water Bodies',
-            style_function=lambda x: {
-                'fillColor': '#4a90e2',
-                'color': '#2e5f8a',
-                'weight': 1,
-                'fillOpacity': 0.7
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'MTFCC'] if 'FULLNAME' in large_water.columns else [],
-                aliases=['Name:', 'Type:']
-            )
+            style_function=lambda x, s=WATER_STYLE: s,
+            tooltip=folium.GeoJsonTooltip(fields=fields, aliases=aliases)
         ).add_to(m)
 
         title_html = '''
@@ -86,7 +419,8 @@ def create_water_areas_map(output_path: str = 'output/vermont_water_areas.html')
         return None
 
 
-def create_linear_water_map(output_path: str = 'output/vermont_rivers.html'):
+def create_linear_water_map(linear_water: gpd.GeoDataFrame,
+                            output_path: str = 'output/vermont_rivers.html'):
     """
     Linear water features - rivers and streams
     """
@@ -95,21 +429,15 @@ def create_linear_water_map(output_path: str = 'output/vermont_rivers.html'):
     print("=" * 60)
 
     try:
-        print("  Downloading linear water features (2022)...")
-        url = "https://www2.census.gov/geo/tiger/TIGER2022/LINEARWATER/tl_2022_50_linearwater.zip"
-        linear_water = gpd.read_file(url)
-
-        if linear_water.crs != 'EPSG:4326':
-            linear_water = linear_water.to_crs('EPSG:4326')
-
-        print(f"  Found {len(linear_water)} linear water features")
-
         # Sample for web performance
         sample_size = min(1500, len(linear_water))
         if len(linear_water) > sample_size:
             print(f"  Sampling {sample_size} features for web display...")
             linear_water = linear_water.sample(n=sample_size, random_state=42)
 
+        linear_water = keep_columns(linear_water, LINEAR_WATER_COLUMNS)
+        fields, aliases = tooltip_fields(linear_water, ('FULLNAME',))
+
         bounds = linear_water.total_bounds
         center_lat = (bounds[1] + bounds[3]) / 2
         center_lon = (bounds[0] + bounds[2]) / 2
@@ -121,16 +449,10 @@ def create_linear_water_map(output_path: str = 'output/vermont_rivers.html'):
         )
 
         folium.GeoJson(
-            linear_water,
+            fast_geojson(linear_water),
             name='Rivers & Streams',
-            style_function=lambda x: {
-                'color': '#3498db',
-                'weight': 2,
-                'opacity': 0.7
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME'] if 'FULLNAME' in linear_water.columns else []
-            )
+            style_function=lambda x, s=RIVER_STYLE: s,
+            tooltip=folium.GeoJsonTooltip(fields=fields, aliases=aliases)
         ).add_to(m)
 
         title_html = '''
@@ -160,7 +482,8 @@ def create_linear_water_map(output_path: str = 'output/vermont_rivers.html'):
         return None
 
 
-def create_champlain_focus_map(output_path: str = 'output/lake_champlain_islands.html'):
+def create_champlain_focus_map(water: gpd.GeoDataFrame, vt_state: gpd.GeoDataFrame,
+                               output_path: str = 'output/lake_champlain_islands.html'):
     """
     Zoomed in on Lake Champlain to see islands clearly
     """
@@ -169,25 +492,16 @@ def create_champlain_focus_map(output_path: str = 'output/lake_champlain_islands
     print("=" * 60)
 
     try:
-        print("  Downloading water areas...")
-        water = gpd.read_file("https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_50_areawater.zip")
-
-        if water.crs != 'EPSG:4326':
-            water = water.to_crs('EPSG:4326')
-
-        # Get state boundary for context
-        print("  Downloading state boundary...")
-        states = gpd.read_file("https://www2.census.gov/geo/tiger/TIGER2023/STATE/tl_2023_us_state.zip")
-        vt_state = states[states['STATEFP'] == '50'].copy()
-        if vt_state.crs != 'EPSG:4326':
-            vt_state = vt_state.to_crs('EPSG:4326')
-
         # Filter water to Champlain region
         champlain_bbox = (-73.5, 43.5, -73.0, 45.2)
         champlain_water = water.cx[champlain_bbox[0]:champlain_bbox[2], champlain_bbox[1]:champlain_bbox[3]].copy()
 
         print(f"  Found {len(champlain_water)} water features in Lake Champlain area")
 
+        vt_state = keep_columns(vt_state, STATE_COLUMNS)
+        champlain_water = keep_columns(champlain_water, WATER_COLUMNS)
+        fields, aliases = tooltip_fields(champlain_water, ('FULLNAME',))
+
         # Create map zoomed to Champlain
         m = folium.Map(
             location=[44.6, -73.25],
@@ -199,27 +513,15 @@ def create_champlain_focus_map(output_path: str = 'output/lake_champlain_islands
         folium.GeoJson(
             vt_state,
             name='Vermont Boundary',
-            style_function=lambda x: {
-                'fillColor': 'transparent',
-                'color': '#2c5f2d',
-                'weight': 2,
-                'fillOpacity': 0
-            }
+            style_function=lambda x, s=STATE_OUTLINE_STYLE: s
         ).add_to(m)
 
         # Add water - islands will show as gaps
         folium.GeoJson(
-            champlain_water,
+            fast_geojson(champlain_water),
             name='Lake Water',
-            style_function=lambda x: {
-                'fillColor': '#1e88e5',
-                'color': '#0d47a1',
-                'weight': 1,
-                'fillOpacity': 0.8
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME'] if 'FULLNAME' in champlain_water.columns else []
-            )
+            style_function=lambda x, s=LAKE_STYLE: s,
+            tooltip=folium.GeoJsonTooltip(fields=fields, aliases=aliases)
         ).add_to(m)
 
         folium.LayerControl().add_to(m)
@@ -253,7 +555,9 @@ def create_champlain_focus_map(output_path: str = 'output/lake_champlain_islands
         return None
 
 
-def create_combined_overview(output_path: str = 'output/vermont_combined.html'):
+def create_combined_overview(vt_state: gpd.GeoDataFrame, vt_counties: gpd.GeoDataFrame,
+                             water: gpd.GeoDataFrame,
+                             output_path: str = 'output/vermont_combined.html'):
     """
     All layers combined for comparison
     """
@@ -270,59 +574,33 @@ def create_combined_overview(output_path: str = 'output/vermont_combined.html'):
 
         # State boundary
         print("  Adding state boundary...")
-        states = gpd.read_file("https://www2.census.gov/geo/tiger/TIGER2023/STATE/tl_2023_us_state.zip")
-        vt_state = states[states['STATEFP'] == '50'].copy()
-        if vt_state.crs != 'EPSG:4326':
-            vt_state = vt_state.to_crs('EPSG:4326')
+        vt_state = keep_columns(vt_state, STATE_COLUMNS)
 
         folium.GeoJson(
             vt_state,
             name='State Boundary',
-            style_function=lambda x: {
-                'fillColor': '#e8f5e9',
-                'color': '#2c5f2d',
-                'weight': 3,
-                'fillOpacity': 0.2
-            }
+            style_function=lambda x, s=STATE_FILL_STYLE: s
         ).add_to(m)
 
         # Counties
         print("  Adding counties...")
-        counties = gpd.read_file("https://www2.census.gov/geo/tiger/TIGER2023/COUNTY/tl_2023_us_county.zip")
-        vt_counties = counties[counties['STATEFP'] == '50'].copy()
-        if vt_counties.crs != 'EPSG:4326':
-            vt_counties = vt_counties.to_crs('EPSG:4326')
+        vt_counties = keep_columns(vt_counties, COUNTY_COLUMNS)
 
         folium.GeoJson(
             vt_counties,
             name='Counties',
-            style_function=lambda x: {
-                'fillColor': 'transparent',
-                'color': '#666',
-                'weight': 1,
-                'dashArray': '5, 5',
-                'fillOpacity': 0
-            },
+            style_function=lambda x, s=COUNTY_STYLE: s,
             tooltip=folium.GeoJsonTooltip(fields=['NAME'])
         ).add_to(m)
 
         # Water areas
         print("  Adding water areas...")
-        water = gpd.read_file("https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_50_areawater.zip")
-        if water.crs != 'EPSG:4326':
-            water = water.to_crs('EPSG:4326')
-        water['area_sqkm'] = water.geometry.area * 111 * 111
-        large_water = water[water['area_sqkm'] > 0.5].copy()
+        large_water = keep_columns(water[water['area_sqkm'] > 0.5], WATER_COLUMNS)
 
         folium.GeoJson(
-            large_water,
+            fast_geojson(large_water),
             name='Water Bodies',
-            style_function=lambda x: {
-                'fillColor': '#4a90e2',
-                'color': '#2e5f8a',
-                'weight': 1,
-                'fillOpacity': 0.7
-            }
+            style_function=lambda x, s=WATER_STYLE: s
         ).add_to(m)
 
         folium.LayerControl().add_to(m)
@@ -355,6 +633,41 @@ def create_combined_overview(output_path: str = 'output/vermont_combined.html'):
         return None
 
 
+# Datasets for forked render workers; set in the parent before the pool
+# starts so children inherit the frames instead of unpickling copies
+_DATASETS = None
+
+
+def _render(job):
+    """
+    Run one map builder in a worker, resolving its frames from _DATASETS
+    """
+    builder, fields = job
+    return builder(*(getattr(_DATASETS, f) for f in fields))
+
+
+def render_all(ds: TigerDatasets) -> list:
+    """
+    Run the four map builders, in parallel processes where fork is available
+    """
+    global _DATASETS
+
+    jobs = [
+        (create_water_areas_map, ('water',)),
+        (create_linear_water_map, ('linear_water',)),
+        (create_champlain_focus_map, ('water', 'vt_state')),
+        (create_combined_overview, ('vt_state', 'vt_counties', 'water')),
+    ]
+
+    _DATASETS = ds
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return [_render(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=len(jobs),
+                             mp_context=multiprocessing.get_context('fork')) as ex:
+        return list(ex.map(_render, jobs))
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Vermont Multi-Dataset Map Generator v2")
@@ -363,22 +676,19 @@ if __name__ == '__main__':
 
     maps_created = []
 
-    # Generate all maps
-    result = create_water_areas_map()
-    if result:
-        maps_created.append(result)
-
-    result = create_linear_water_map()
-    if result:
-        maps_created.append(result)
-
-    result = create_champlain_focus_map()
-    if result:
-        maps_created.append(result)
+    # Download each dataset once and share it across the builders
+    try:
+        ds = load_datasets()
+    except Exception as e:
+        print(f"✗ Error loading datasets: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
 
-    result = create_combined_overview()
-    if result:
-        maps_created.append(result)
+    # Generate all maps
+    for result in render_all(ds):
+        if result:
+            maps_created.append(result)
 
     # Summary
     print("\n" + "=" * 60)
@@ -6,8 +6,188 @@ Combines categorized VT water data with NY Lake Champlain data
 
 import folium
 import json
+import math
 from pathlib import Path
 
+# Layer styles, shared by reference so style_function allocates nothing
+# per feature
+VT_BOUNDARY_STYLE = {
+    'fillColor': 'transparent',
+    'color': '#2c5f2d',
+    'weight': 2,
+    'fillOpacity': 0,
+    'dashArray': '5, 5'
+}
+
+NY_BOUNDARY_STYLE = {
+    'fillColor': 'transparent',
+    'color': '#1a237e',
+    'weight': 2,
+    'fillOpacity': 0,
+    'dashArray': '5, 5'
+}
+
+VT_BIG_LAKE_STYLE = {
+    'fillColor': '#0d47a1',
+    'color': '#01579b',
+    'weight': 1,
+    'fillOpacity': 0.7
+}
+
+VT_RIVERS_STYLE = {
+    'fillColor': '#4fc3f7',
+    'color': '#0288d1',
+    'weight': 1,
+    'fillOpacity': 0.6
+}
+
+VT_SMALL_PONDS_STYLE = {
+    'fillColor': '#b3e5fc',
+    'color': '#4fc3f7',
+    'weight': 0.5,
+    'fillOpacity': 0.5
+}
+
+NY_WATER_STYLE = {
+    'fillColor': '#5c6bc0',
+    'color': '#3949ab',
+    'weight': 1,
+    'fillOpacity': 0.7
+}
+
+VT_BIG_LAKE_VECTOR_STYLE = {
+    'fillColor': '#0d47a1',
+    'color': '#000000',
+    'weight': 1,
+    'fillOpacity': 0.8
+}
+
+VT_RIVERS_VECTOR_STYLE = {
+    'fillColor': '#4fc3f7',
+    'color': '#000000',
+    'weight': 1,
+    'fillOpacity': 0.7
+}
+
+VT_SMALL_PONDS_VECTOR_STYLE = {
+    'fillColor': '#b3e5fc',
+    'color': '#000000',
+    'weight': 0.5,
+    'fillOpacity': 0.6
+}
+
+NY_WATER_VECTOR_STYLE = {
+    'fillColor': '#5c6bc0',
+    'color': '#000000',
+    'weight': 1,
+    'fillOpacity': 0.8
+}
+
+# Width of the SVG viewBox for the vector-only map; height follows the data
+SVG_WIDTH = 1000
+
+
+def iter_rings(geometry: dict):
+    """
+    Yield (ring coordinates, closed) for each ring or line of a GeoJSON geometry
+
+    Points have no outline to draw and are skipped, as are rings and lines
+    with fewer than two points.
+    """
+    gtype = geometry['type']
+    if gtype == 'GeometryCollection':
+        for part in geometry['geometries']:
+            yield from iter_rings(part)
+        return
+
+    coords = geometry['coordinates']
+    if gtype == 'Polygon':
+        rings = [(ring, True) for ring in coords]
+    elif gtype == 'MultiPolygon':
+        rings = [(ring, True) for polygon in coords for ring in polygon]
+    elif gtype == 'LineString':
+        rings = [(coords, False)]
+    elif gtype == 'MultiLineString':
+        rings = [(line, False) for line in coords]
+    else:
+        # Point and MultiPoint
+        rings = []
+
+    for ring, closed in rings:
+        if len(ring) >= 2:
+            yield ring, closed
+
+
+def geojson_bounds(collections: list) -> tuple:
+    """
+    Compute (minx, miny, maxx, maxy) over every feature in the collections
+    """
+    minx = miny = math.inf
+    maxx = maxy = -math.inf
+    for collection in collections:
+        for feature in collection['features']:
+            if not feature.get('geometry'):
+                continue
+            for ring, _ in iter_rings(feature['geometry']):
+                for x, y in (pt[:2] for pt in ring):
+                    minx, maxx = min(minx, x), max(maxx, x)
+                    miny, maxy = min(miny, y), max(maxy, y)
+    return minx, miny, maxx, maxy
+
+
+def render_svg(layers: list, bbox: tuple) -> str:
+    """
+    Render GeoJSON layers as a static SVG string
+
+    Args:
+        layers: List of (FeatureCollection, style dict) pairs, bottom to top.
+            Style dicts use the same keys as folium style functions.
+        bbox: (minx, miny, maxx, maxy) in lon/lat
+
+    Returns:
+        <svg> element with one <path> per feature
+    """
+    minx, miny, maxx, maxy = bbox
+    if not (maxx > minx and maxy > miny):
+        raise ValueError(f"Nothing to draw: empty bounding box {bbox}")
+
+    # Equirectangular projection scaled to the mid-latitude of the bbox
+    x_scale = math.cos(math.radians((miny + maxy) / 2))
+    scale = SVG_WIDTH / ((maxx - minx) * x_scale)
+    height = (maxy - miny) * scale
+
+    def ring_path(ring, closed):
+        points = ' L'.join(
+            f"{(x - minx) * x_scale * scale:.2f},{(maxy - y) * scale:.2f}"
+            for x, y in (pt[:2] for pt in ring)
+        )
+        return f"M{points}{' Z' if closed else ''}"
+
+    groups = []
+    for collection, style in layers:
+        paths = []
+        for feature in collection['features']:
+            if not feature.get('geometry'):
+                continue
+            d = ' '.join(ring_path(ring, closed) for ring, closed in iter_rings(feature['geometry']))
+            if d:
+                paths.append(f'<path d="{d}"/>')
+        groups.append(
+            f'<g fill="{style.get("fillColor", "none")}" '
+            f'fill-opacity="{style.get("fillOpacity", 1)}" '
+            f'stroke="{style.get("color", "none")}" '
+            f'stroke-width="{style.get("weight", 1)}" '
+            f'fill-rule="evenodd">'
+            + ''.join(paths) + '</g>'
+        )
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {SVG_WIDTH} {height:.2f}" '
+        f'preserveAspectRatio="xMidYMid meet">'
+        '<style>path { vector-effect: non-scaling-stroke; }</style>'
+        + ''.join(groups) + '</svg>'
+    )
+
 
 def create_champlain_ny_vt_map(output_path: str = 'docs/champlain_ny_vt.html'):
     """
@@ -58,37 +238,20 @@ def create_champlain_ny_vt_map(output_path: str = 'docs/champlain_ny_vt.html'):
         folium.GeoJson(
             vt_boundary,
             name='Vermont Boundary',
-            style_function=lambda x: {
-                'fillColor': 'transparent',
-                'color': '#2c5f2d',
-                'weight': 2,
-                'fillOpacity': 0,
-                'dashArray': '5, 5'
-            }
+            style_function=lambda x, s=VT_BOUNDARY_STYLE: s
         ).add_to(m)
 
         folium.GeoJson(
             ny_boundary,
             name='New York Boundary',
-            style_function=lambda x: {
-                'fillColor': 'transparent',
-                'color': '#1a237e',
-                'weight': 2,
-                'fillOpacity': 0,
-                'dashArray': '5, 5'
-            }
+            style_function=lambda x, s=NY_BOUNDARY_STYLE: s
         ).add_to(m)
 
         # Add VT water features (categorized)
         folium.GeoJson(
             vt_big_lake,
             name='VT - Lake Champlain Main Body',
-            style_function=lambda x: {
-                'fillColor': '#0d47a1',
-                'color': '#01579b',
-                'weight': 1,
-                'fillOpacity': 0.7
-            },
+            style_function=lambda x, s=VT_BIG_LAKE_STYLE: s,
             tooltip=folium.GeoJsonTooltip(
                 fields=['FULLNAME', 'area_sqkm'],
                 aliases=['Name:', 'Area (sq km):']
@@ -98,12 +261,7 @@ def create_champlain_ny_vt_map(output_path: str = 'docs/champlain_ny_vt.html'):
         folium.GeoJson(
             vt_rivers,
             name='VT - Rivers & Streams',
-            style_function=lambda x: {
-                'fillColor': '#4fc3f7',
-                'color': '#0288d1',
-                'weight': 1,
-                'fillOpacity': 0.6
-            },
+            style_function=lambda x, s=VT_RIVERS_STYLE: s,
             tooltip=folium.GeoJsonTooltip(
                 fields=['FULLNAME', 'area_sqkm'],
                 aliases=['Name:', 'Area (sq km):']
@@ -113,12 +271,7 @@ def create_champlain_ny_vt_map(output_path: str = 'docs/champlain_ny_vt.html'):
         folium.GeoJson(
             vt_small_ponds,
             name='VT - Small Ponds & Lakes',
-            style_function=lambda x: {
-                'fillColor': '#b3e5fc',
-                'color': '#4fc3f7',
-                'weight': 0.5,
-                'fillOpacity': 0.5
-            },
+            style_function=lambda x, s=VT_SMALL_PONDS_STYLE: s,
             tooltip=folium.GeoJsonTooltip(
                 fields=['FULLNAME', 'area_sqkm'],
                 aliases=['Name:', 'Area (sq km):']
@@ -129,12 +282,7 @@ def create_champlain_ny_vt_map(output_path: str = 'docs/champlain_ny_vt.html'):
         folium.GeoJson(
             ny_water,
             name='NY - Lake Champlain',
-            style_function=lambda x: {
-                'fillColor': '#5c6bc0',
-                'color': '#3949ab',
-                'weight': 1,
-                'fillOpacity': 0.7
-            },
+            style_function=lambda x, s=NY_WATER_STYLE: s,
             tooltip=folium.GeoJsonTooltip(
                 fields=['FULLNAME'],
                 aliases=['Name:']
@@ -233,67 +381,15 @@ def create_champlain_ny_vt_vector_map(output_path: str = 'docs/champlain_ny_vt_v
         with open('docs/json/ny_lake_champlain_water.json', 'r') as f:
             ny_water = json.load(f)
 
-        # Create map with no tiles (vector only)
-        m = folium.Map(
-            location=[44.5, -73.3],
-            zoom_start=9,
-            tiles=None,
-            attr='Vector Data Only'
-        )
-
-        # Add white background
-        m.get_root().html.add_child(folium.Element(
-            '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
-        ))
-
-        # Add VT water features (categorized) with black outlines
-        folium.GeoJson(
-            vt_big_lake,
-            name='VT - Lake Champlain Main Body',
-            style_function=lambda x: {
-                'fillColor': '#0d47a1',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.8
-            }
-        ).add_to(m)
-
-        folium.GeoJson(
-            vt_rivers,
-            name='VT - Rivers & Streams',
-            style_function=lambda x: {
-                'fillColor': '#4fc3f7',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.7
-            }
-        ).add_to(m)
-
-        folium.GeoJson(
-            vt_small_ponds,
-            name='VT - Small Ponds & Lakes',
-            style_function=lambda x: {
-                'fillColor': '#b3e5fc',
-                'color': '#000000',
-                'weight': 0.5,
-                'fillOpacity': 0.6
-            }
-        ).add_to(m)
-
-        # Add NY Lake Champlain water
-        folium.GeoJson(
-            ny_water,
-            name='NY - Lake Champlain',
-            style_function=lambda x: {
-                'fillColor': '#5c6bc0',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.8
-            }
-        ).add_to(m)
-
-        # Add layer control
-        folium.LayerControl(position='topright', collapsed=False).add_to(m)
+        # Vector-only output is a static SVG; no Leaflet runtime needed
+        layers = [
+            (vt_big_lake, VT_BIG_LAKE_VECTOR_STYLE),
+            (vt_rivers, VT_RIVERS_VECTOR_STYLE),
+            (vt_small_ponds, VT_SMALL_PONDS_VECTOR_STYLE),
+            (ny_water, NY_WATER_VECTOR_STYLE),
+        ]
+        bbox = geojson_bounds([layer for layer, _ in layers])
+        svg = render_svg(layers, bbox)
 
         # Add title
         title_html = '''
@@ -307,7 +403,6 @@ def create_champlain_ny_vt_vector_map(output_path: str = 'docs/champlain_ny_vt_v
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
         # Add back button
         back_button_html = '''
@@ -319,12 +414,29 @@ def create_champlain_ny_vt_vector_map(output_path: str = 'docs/champlain_ny_vt_v
             <span>Back to Index</span>
         </a>
         '''
-        m.get_root().html.add_child(folium.Element(back_button_html))
+
+        html = f'''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Lake Champlain NY & VT - Vector Data Only</title>
+    <style>
+        body {{ margin: 0; background-color: white; font-family: sans-serif; }}
+        svg {{ display: block; width: 100vw; height: 100vh; }}
+    </style>
+</head>
+<body>
+{svg}
+{title_html}
+{back_button_html}
+</body>
+</html>
+'''
 
         # Save map
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output.write_text(html, encoding='utf-8')
 
         print(f"✓ Saved to {output_path}")
         return str(output)
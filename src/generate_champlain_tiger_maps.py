@@ -4,355 +4,462 @@ Generate visualization maps for Champlain TIGER HYDROID data sources
 Separate maps for VT and NY Champlain water features
 """
 
-import folium
+import jinja2
 import json
+import mmap
+import orjson
+import shapely
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from folium.elements import JSCSSMixin
+from folium.map import Layer
 from pathlib import Path
+from string import Template
 
+from generate_all_maps_v2 import write_compressed
 
-def create_vt_champlain_tiger_map(output_path: str = 'docs/vt_champlain_tiger.html'):
-    """
-    Create Vermont Champlain TIGER HYDROIDs map
-    """
-    print("\n" + "=" * 60)
-    print("Creating: VT Champlain TIGER HYDROIDs Map")
-    print("=" * 60)
+# Douglas-Peucker tolerances in degrees (0.0005 ≈ 50 m at 44°N, about one
+# pixel at zoom 9); vector-only maps have no basemap to align with
+SIMPLIFY_TOLERANCE = 0.0005
+VECTOR_SIMPLIFY_TOLERANCE = 0.001
 
-    try:
-        # Load VT Champlain TIGER data
-        print("  Loading VT Champlain TIGER HYDROIDs data...")
-        with open('docs/json/vt_champlain_tiger_hydroids.json', 'r') as f:
-            vt_champlain = json.load(f)
+# Initial zoom of every map
+ZOOM_START = 9
 
-        metadata = vt_champlain.get('metadata', {})
-        print(f"  Features: {metadata.get('total_features', 'Unknown')}")
-        print(f"  Total area: {metadata.get('total_area_sqkm', 'Unknown')} sq km")
+# Decimal places kept for lon/lat (6 ≈ 0.1 m), far below a pixel at any
+# zoom these maps are viewed at
+COORD_PRECISION = 6
 
-        # Create map centered on Lake Champlain (VT side)
-        m = folium.Map(
-            location=[44.5, -73.2],
-            zoom_start=9,
-            tiles='OpenStreetMap'
-        )
+# Pre-built vector tiles live under docs/ so maps can reference them relatively
+TILES_DIR = Path('docs/tiles')
+TILE_LAYER = 'water'
 
-        # Add water features
-        folium.GeoJson(
-            vt_champlain,
-            name='VT Champlain Water',
-            style_function=lambda x: {
-                'fillColor': '#1976d2',
-                'color': '#0d47a1',
-                'weight': 2,
-                'fillOpacity': 0.6
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'HYDROID', 'area_sqkm'],
-                aliases=['Name:', 'Hydro ID:', 'Area (sq km):'],
-                localize=True
-            )
-        ).add_to(m)
-
-        # Add layer control
-        folium.LayerControl(position='topright', collapsed=False).add_to(m)
-
-        # Add title
-        title_html = f'''
-        <div style="position: fixed; top: 10px; left: 50px; width: 450px;
-                    background-color: white; border: 2px solid #1976d2;
+# Water styles: standard maps outline in a darker shade of the fill,
+# vector-only maps outline in black
+VT_STYLE = {'fillColor': '#1976d2', 'color': '#0d47a1', 'weight': 2, 'fillOpacity': 0.6}
+NY_STYLE = {'fillColor': '#d32f2f', 'color': '#b71c1c', 'weight': 2, 'fillOpacity': 0.6}
+VT_VECTOR_STYLE = {'fillColor': '#1976d2', 'color': '#000000', 'weight': 2, 'fillOpacity': 0.7}
+NY_VECTOR_STYLE = {'fillColor': '#d32f2f', 'color': '#000000', 'weight': 2, 'fillOpacity': 0.7}
+
+# Overlay panels shared by every Champlain TIGER map
+TITLE_TEMPLATE = Template('''
+        <div style="position: fixed; top: 10px; left: 50px; width: ${width}px;
+                    background-color: white; border: 2px solid $color;
                     border-radius: 8px; z-index: 9999; padding: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);">
-            <h4 style="margin: 0 0 10px 0; color: #1976d2;">VT Champlain TIGER HYDROIDs</h4>
+            <h4 style="margin: 0 0 10px 0; color: $color;">$title</h4>
             <p style="margin: 5px 0; font-size: 12px; color: #666;">
-                Water features touching Champlain Islands or VT coast<br>
-                <b>{metadata.get('total_features', 0)} features</b> •
-                <b>{metadata.get('total_area_sqkm', 0):.2f} sq km</b>
-            </p>
+                $body
+            </p>$details
             <p style="margin: 10px 0 0 0; font-size: 10px; color: #999; font-style: italic;">
-                Source: US Census TIGER/Line 2022 (Filtered by HYDROID)<br>
-                Collection: Interactive selection from mashup map
+                $source
+            </p>
+        </div>
+        ''')
+
+VECTOR_TITLE_TEMPLATE = Template('''
+        <div style="position: fixed; top: 10px; left: 50px; width: ${width}px;
+                    background-color: white; border: 2px solid #000;
+                    border-radius: 5px; z-index: 9999; padding: 10px;">
+            <h4 style="margin: 0;">$title</h4>
+            <p style="margin: 5px 0 0 0; font-size: 12px;">
+                $body
             </p>
         </div>
-        '''
-        m.get_root().html.add_child(folium.Element(title_html))
+        ''')
 
-        # Add back button
-        back_button_html = '''
+BACK_BUTTON_TEMPLATE = Template('''
         <a href="index.html" style="position: fixed; top: 10px; left: 10px; background: white;
                                      padding: 10px 15px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-                                     z-index: 9999; text-decoration: none; color: #1976d2; font-weight: 600;
+                                     z-index: 9999; text-decoration: none; color: $color; font-weight: 600;
                                      font-size: 14px; display: flex; align-items: center; gap: 5px;">
             <span>←</span>
             <span>Back to Index</span>
         </a>
-        '''
-        m.get_root().html.add_child(folium.Element(back_button_html))
+        ''')
 
-        # Save map
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+# Templates under src/templates/ are compiled on first load and never
+# evicted or re-checked on disk for the life of the process
+TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent / 'templates'),
+    cache_size=-1,
+    auto_reload=False
+)
 
-        print(f"✓ Saved to {output_path}")
-        return str(output)
+# Leaflet page skeleton shared by every Champlain TIGER map, compiled at import
+MAP_TEMPLATE = TEMPLATE_ENV.get_template('champlain_map.html.j2')
 
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+# Stand-in for the features JSON while rendering; save_map() writes the
+# real data in its place
+FEATURES_MARKER = '/*@features@*/'
 
+# Property/label pairs shown in water feature tooltips
+TOOLTIP_FIELDS = (
+    ('FULLNAME', 'Name:'),
+    ('HYDROID', 'Hydro ID:'),
+    ('area_sqkm', 'Area (sq km):'),
+)
 
-def create_vt_champlain_tiger_vector_map(output_path: str = 'docs/vt_champlain_tiger_vector.html'):
+
+def load_geojson(path: str) -> tuple:
     """
-    Create vector-only version of VT Champlain TIGER map
+    Load a FeatureCollection file into (metadata, FeatureCollection dict)
+
+    The file is memory-mapped and parsed once with orjson (no intermediate
+    bytes copy), coordinates are rounded to COORD_PRECISION and the
+    metadata block is split off so only the features are embedded in the
+    map.
     """
-    print("\n" + "=" * 60)
-    print("Creating: VT Champlain TIGER Vector-Only Map")
-    print("=" * 60)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as buf:
+            data = orjson.loads(buf)
+    metadata = data.pop('metadata', {})
+    for feature in data['features']:
+        geometry = feature.get('geometry')
+        if geometry:
+            geometry['coordinates'] = round_coordinates(geometry['coordinates'])
+    return metadata, data
+
+
+def round_coordinates(coords, ndigits: int = COORD_PRECISION):
+    """
+    Round a (possibly nested) GeoJSON coordinate array to ndigits places
+    """
+    if coords and isinstance(coords[0], (int, float)):
+        return [round(c, ndigits) for c in coords]
+    return [round_coordinates(c, ndigits) for c in coords]
 
-    try:
-        # Load VT Champlain TIGER data
-        print("  Loading VT Champlain TIGER HYDROIDs data...")
-        with open('docs/json/vt_champlain_tiger_hydroids.json', 'r') as f:
-            vt_champlain = json.load(f)
-
-        metadata = vt_champlain.get('metadata', {})
-
-        # Create map with no tiles (vector only)
-        m = folium.Map(
-            location=[44.5, -73.2],
-            zoom_start=9,
-            tiles=None,
-            attr='Vector Data Only'
-        )
 
-        # Add white background
-        m.get_root().html.add_child(folium.Element(
-            '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
-        ))
-
-        # Add water features with black outlines
-        folium.GeoJson(
-            vt_champlain,
-            name='VT Champlain Water',
-            style_function=lambda x: {
-                'fillColor': '#1976d2',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.7
-            }
-        ).add_to(m)
-
-        # Add title
-        title_html = f'''
-        <div style="position: fixed; top: 10px; left: 50px; width: 400px;
-                    background-color: white; border: 2px solid #000;
-                    border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">VT Champlain TIGER - Vector Data Only</h4>
-            <p style="margin: 5px 0 0 0; font-size: 12px;">
-                No base map - pure vector data visualization<br>
-                {metadata.get('total_features', 0)} water features
-            </p>
-        </div>
-        '''
-        m.get_root().html.add_child(folium.Element(title_html))
+def simplify_geojson(data: dict, tolerance: float, precision: int = None) -> dict:
+    """
+    Return a copy of a FeatureCollection with simplified geometries
 
-        # Add back button
-        back_button_html = '''
-        <a href="index.html" style="position: fixed; top: 10px; left: 10px; background: white;
-                                     padding: 10px 15px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-                                     z-index: 9999; text-decoration: none; color: #000; font-weight: 600;
-                                     font-size: 14px; display: flex; align-items: center; gap: 5px;">
-            <span>←</span>
-            <span>Back to Index</span>
-        </a>
-        '''
-        m.get_root().html.add_child(folium.Element(back_button_html))
+    Uses topology-preserving Douglas-Peucker so rings stay valid and
+    islands are not collapsed. If precision is given, coordinates are
+    then rounded to that many decimal places. Features without a geometry
+    are passed through. The input is left untouched so cached collections
+    can be simplified at different tolerances.
+    """
+    features = list(data['features'])
+    present = [i for i, f in enumerate(features) if f.get('geometry')]
+    geoms = shapely.simplify(
+        [shapely.geometry.shape(features[i]['geometry']) for i in present],
+        tolerance,
+        preserve_topology=True
+    )
+    if precision is not None:
+        geoms = shapely.transform(geoms, lambda coords: coords.round(precision))
+    for i, geom in zip(present, geoms):
+        features[i] = {**features[i], 'geometry': shapely.geometry.mapping(geom)}
+    return {**data, 'features': features}
+
+
+def select_properties(data: dict, keys: tuple) -> dict:
+    """
+    Return a copy of a FeatureCollection carrying only the given properties
 
-        # Save map
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+    Missing keys are kept as None so tooltips render consistently.
+    """
+    return {
+        **data,
+        'features': [
+            {**f, 'properties': {k: f['properties'].get(k) for k in keys}}
+            for f in data['features']
+        ]
+    }
 
-        print(f"✓ Saved to {output_path}")
-        return str(output)
 
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+def flatten_geojson(data: dict) -> dict:
+    """
+    Return a copy of a FeatureCollection with flattened polygon coordinates
+
+    Each Polygon/MultiPolygon's nested coordinates are replaced with
+    {"flat": [x0, y0, x1, y1, ...], "rings": [points per ring]} plus
+    "parts" (rings per polygon) for MultiPolygons. This drops most of the
+    bracket/comma bytes from the embedded JSON; the map template rebuilds
+    the nested arrays in the browser before handing them to Leaflet.
+    """
+    features = []
+    for feature in data['features']:
+        geometry = feature['geometry']
+        if not geometry or geometry['type'] not in ('Polygon', 'MultiPolygon'):
+            features.append(feature)
+            continue
+
+        multi = geometry['type'] == 'MultiPolygon'
+        polygons = geometry['coordinates'] if multi else [geometry['coordinates']]
+        flat, rings, parts = [], [], []
+        for polygon in polygons:
+            parts.append(len(polygon))
+            for ring in polygon:
+                rings.append(len(ring))
+                for point in ring:
+                    flat += point[:2]
+
+        coordinates = {'flat': flat, 'rings': rings}
+        if multi:
+            coordinates['parts'] = parts
+        features.append({**feature, 'geometry': {'type': geometry['type'], 'coordinates': coordinates}})
+
+    return {**data, 'features': features}
+
+
+def build_tiles(geojson_path: str, name: str, tiles_dir: Path = TILES_DIR) -> str:
+    """
+    Pre-tile a GeoJSON file into <tiles_dir>/<name>/{z}/{x}/{y}.pbf
+
+    Runs tippecanoe with an automatic max zoom, dropping the densest
+    features where a tile would overflow. Tiles are left uncompressed so
+    they can be served as static files.
+
+    Returns:
+        Tile URL template relative to the parent of tiles_dir, or None if
+        tippecanoe is not installed (maps then fall back to embedded GeoJSON)
+    """
+    tippecanoe = shutil.which('tippecanoe')
+    if tippecanoe is None:
         return None
 
+    out_dir = Path(tiles_dir) / name
+    print(f"  Building vector tiles for {geojson_path}...")
+    subprocess.run([
+        tippecanoe, '-zg', '--drop-densest-as-needed', '--no-tile-compression',
+        '--force', '-l', TILE_LAYER, '-e', str(out_dir), geojson_path
+    ], check=True)
+    return f"{Path(tiles_dir).name}/{name}/{{z}}/{{x}}/{{y}}.pbf"
+
 
-def create_ny_champlain_tiger_map(output_path: str = 'docs/ny_champlain_tiger.html'):
+class VectorTileLayer(JSCSSMixin, Layer):
     """
-    Create New York Champlain TIGER HYDROIDs map
+    Leaflet.VectorGrid layer drawing pre-built .pbf tiles on a canvas
+
+    style_js is a JavaScript path-options object, or a function of a
+    feature's properties returning one.
     """
-    print("\n" + "=" * 60)
-    print("Creating: NY Champlain TIGER HYDROIDs Map")
-    print("=" * 60)
+    _template = jinja2.Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }} = L.vectorGrid.protobuf({{ this.url|tojson }}, {
+            rendererFactory: L.canvas.tile,
+            vectorTileLayerStyles: {{ '{' }}{{ this.tile_layer|tojson }}: {{ this.style_js }}{{ '}' }}
+        });
+        {% endmacro %}
+    """)
+
+    default_js = [
+        ('leaflet.vectorgrid',
+         'https://unpkg.com/leaflet.vectorgrid@1.3.0/dist/Leaflet.VectorGrid.bundled.min.js'),
+    ]
+
+    def __init__(self, url: str, style_js: str, name: str = None, **kwargs):
+        super().__init__(name=name, overlay=True, **kwargs)
+        self._name = 'VectorTileLayer'
+        self.url = url
+        self.style_js = style_js
+        self.tile_layer = TILE_LAYER
+
+
+def save_map(output_path: str, features: dict, **context) -> Path:
+    """
+    Render MAP_TEMPLATE to output_path plus pre-compressed copies
 
-    try:
-        # Load NY Champlain TIGER data
-        print("  Loading NY Champlain TIGER HYDROIDs data...")
-        with open('docs/json/ny_champlain_tiger_hydroids.json', 'r') as f:
-            ny_champlain = json.load(f)
+    The page is rendered around FEATURES_MARKER and the serialized features
+    are streamed in between the two halves through write_compressed(), so
+    the finished page never exists as one string next to the features
+    JSON.
+    """
+    html = MAP_TEMPLATE.render(features_json=FEATURES_MARKER, **context)
+    pre, marker, post = html.partition(FEATURES_MARKER)
 
-        metadata = ny_champlain.get('metadata', {})
-        print(f"  Features: {metadata.get('total_features', 'Unknown')}")
-        print(f"  Total area: {metadata.get('total_area_sqkm', 'Unknown')} sq km")
+    # Escape '</' so a property value can never close the <script> tag
+    chunks = (
+        pre.encode('utf-8'),
+        orjson.dumps(features).replace(b'</', b'<\\/') if marker else b'',
+        post.encode('utf-8'),
+    )
 
-        # Create map centered on Lake Champlain (NY side)
-        m = folium.Map(
-            location=[44.3, -73.4],
-            zoom_start=9,
-            tiles='OpenStreetMap'
-        )
+    return write_compressed(output_path, chunks)
 
-        # Add water features
-        folium.GeoJson(
-            ny_champlain,
-            name='NY Champlain Water',
-            style_function=lambda x: {
-                'fillColor': '#d32f2f',
-                'color': '#b71c1c',
-                'weight': 2,
-                'fillOpacity': 0.6
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'HYDROID', 'area_sqkm'],
-                aliases=['Name:', 'Hydro ID:', 'Area (sq km):'],
-                localize=True
-            )
-        ).add_to(m)
-
-        # Add layer control
-        folium.LayerControl(position='topright', collapsed=False).add_to(m)
-
-        # Add title
-        title_html = f'''
-        <div style="position: fixed; top: 10px; left: 50px; width: 450px;
-                    background-color: white; border: 2px solid #d32f2f;
-                    border-radius: 8px; z-index: 9999; padding: 15px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);">
-            <h4 style="margin: 0 0 10px 0; color: #d32f2f;">NY Champlain TIGER HYDROIDs</h4>
-            <p style="margin: 5px 0; font-size: 12px; color: #666;">
-                Water features touching Lake Champlain on NY side<br>
-                <b>{metadata.get('total_features', 0)} features</b> •
-                <b>{metadata.get('total_area_sqkm', 0):.2f} sq km</b>
-            </p>
-            <p style="margin: 10px 0 0 0; font-size: 10px; color: #999; font-style: italic;">
-                Source: US Census TIGER/Line 2022 (Filtered by HYDROID)<br>
-                Collection: Interactive selection from mashup map
-            </p>
-        </div>
-        '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
-        # Add back button
-        back_button_html = '''
-        <a href="index.html" style="position: fixed; top: 10px; left: 10px; background: white;
-                                     padding: 10px 15px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-                                     z-index: 9999; text-decoration: none; color: #d32f2f; font-weight: 600;
-                                     font-size: 14px; display: flex; align-items: center; gap: 5px;">
-            <span>←</span>
-            <span>Back to Index</span>
-        </a>
-        '''
-        m.get_root().html.add_child(folium.Element(back_button_html))
+def style_js(style: dict) -> str:
+    """
+    JavaScript style function returning one fixed Leaflet path style
+    """
+    return f"function() {{ return {json.dumps({'fill': True, **style})}; }}"
 
-        # Save map
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
 
-        print(f"✓ Saved to {output_path}")
-        return str(output)
+@dataclass(frozen=True, slots=True)
+class MapConfig:
+    """
+    Everything that differs between the Champlain TIGER standard/vector map pairs
 
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+    Panel bodies are str.format templates filled from the source file's
+    metadata block (missing counts read as 0).
+    """
+    input_json: str
+    output_html: str
+    vector_output_html: str
+    tiles_name: str
+    center: tuple
+    layer_name: str
+    title: str
+    vector_title: str
+    badge_color: str
+    title_width: int
+    vector_title_width: int
+    body: str
+    vector_body: str
+    style_js: str
+    vector_style_js: str
+    tooltip: tuple = TOOLTIP_FIELDS
+    details: str = ''
+    source: str = ('Source: US Census TIGER/Line 2022 (Filtered by HYDROID)<br>'
+                   'Collection: Interactive selection from mashup map')
+
+
+class MetadataDefaults(dict):
+    """
+    Metadata mapping for str.format_map that reads missing keys as 0
+    """
+    def __missing__(self, key):
+        return 0
 
 
-def create_ny_champlain_tiger_vector_map(output_path: str = 'docs/ny_champlain_tiger_vector.html'):
+def create_champlain_tiger_maps(config: MapConfig) -> list:
     """
-    Create vector-only version of NY Champlain TIGER map
+    Create the standard and vector-only maps described by a MapConfig
+
+    Both pages are rendered from one load of the source data, and the
+    vector-only geometry is simplified from the standard map's geometry
+    rather than from the full-resolution source. The source is pre-tiled
+    first when tippecanoe is available.
     """
     print("\n" + "=" * 60)
-    print("Creating: NY Champlain TIGER Vector-Only Map")
+    print(f"Creating: {config.title} Maps")
     print("=" * 60)
 
     try:
-        # Load NY Champlain TIGER data
-        print("  Loading NY Champlain TIGER HYDROIDs data...")
-        with open('docs/json/ny_champlain_tiger_hydroids.json', 'r') as f:
-            ny_champlain = json.load(f)
-
-        metadata = ny_champlain.get('metadata', {})
-
-        # Create map with no tiles (vector only)
-        m = folium.Map(
-            location=[44.3, -73.4],
-            zoom_start=9,
-            tiles=None,
-            attr='Vector Data Only'
-        )
-
-        # Add white background
-        m.get_root().html.add_child(folium.Element(
-            '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
-        ))
-
-        # Add water features with black outlines
-        folium.GeoJson(
-            ny_champlain,
-            name='NY Champlain Water',
-            style_function=lambda x: {
-                'fillColor': '#d32f2f',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.7
-            }
-        ).add_to(m)
-
-        # Add title
-        title_html = f'''
-        <div style="position: fixed; top: 10px; left: 50px; width: 400px;
-                    background-color: white; border: 2px solid #000;
-                    border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">NY Champlain TIGER - Vector Data Only</h4>
-            <p style="margin: 5px 0 0 0; font-size: 12px;">
-                No base map - pure vector data visualization<br>
-                {metadata.get('total_features', 0)} water features
-            </p>
-        </div>
-        '''
-        m.get_root().html.add_child(folium.Element(title_html))
+        print(f"  Loading {config.input_json}...")
+        metadata, data = load_geojson(config.input_json)
+        # Only tooltip fields are read in the browser (styles key off them too)
+        data = select_properties(data, tuple(field for field, _ in config.tooltip))
+        data = simplify_geojson(data, SIMPLIFY_TOLERANCE)
+        vector_data = simplify_geojson(data, VECTOR_SIMPLIFY_TOLERANCE)
+        metadata = MetadataDefaults(metadata)
+        print(f"  Features: {metadata.get('total_features', 'Unknown')}")
+        print(f"  Total area: {metadata.get('total_area_sqkm', 'Unknown')} sq km")
 
-        # Add back button
-        back_button_html = '''
-        <a href="index.html" style="position: fixed; top: 10px; left: 10px; background: white;
-                                     padding: 10px 15px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-                                     z-index: 9999; text-decoration: none; color: #000; font-weight: 600;
-                                     font-size: 14px; display: flex; align-items: center; gap: 5px;">
-            <span>←</span>
-            <span>Back to Index</span>
-        </a>
-        '''
-        m.get_root().html.add_child(folium.Element(back_button_html))
+        # Settings shared by both pages
+        shared = dict(
+            center=list(config.center),
+            zoom=ZOOM_START,
+            layer_name=config.layer_name,
+            tiles_url=build_tiles(config.input_json, config.tiles_name),
+            tile_layer=TILE_LAYER,
+        )
 
-        # Save map
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        # Standard map over OpenStreetMap
+        output = save_map(
+            config.output_html,
+            flatten_geojson(data),
+            title=config.title,
+            basemap=True,
+            style_js=config.style_js,
+            layer_control=True,
+            tooltip=config.tooltip,
+            title_html=TITLE_TEMPLATE.substitute(
+                width=config.title_width,
+                color=config.badge_color,
+                title=config.title,
+                body=config.body.format_map(metadata),
+                details=config.details.format_map(metadata),
+                source=config.source
+            ),
+            back_button_html=BACK_BUTTON_TEMPLATE.substitute(color=config.badge_color),
+            **shared
+        )
+        print(f"✓ Saved to {config.output_html}")
+
+        # Vector-only map with black outlines
+        vector_output = save_map(
+            config.vector_output_html,
+            flatten_geojson(vector_data),
+            title=config.vector_title,
+            basemap=False,
+            style_js=config.vector_style_js,
+            layer_control=False,
+            tooltip=None,
+            title_html=VECTOR_TITLE_TEMPLATE.substitute(
+                width=config.vector_title_width,
+                title=config.vector_title,
+                body=config.vector_body.format_map(metadata)
+            ),
+            back_button_html=BACK_BUTTON_TEMPLATE.substitute(color='#000'),
+            **shared
+        )
+        print(f"✓ Saved to {config.vector_output_html}")
 
-        print(f"✓ Saved to {output_path}")
-        return str(output)
+        return [str(output), str(vector_output)]
 
     except Exception as e:
         print(f"✗ Error: {e}")
         import traceback
         traceback.print_exc()
-        return None
+        return []
+
+
+def render_configs(configs: list) -> list:
+    """
+    Build every config's map pair in parallel processes; returns all paths written
+    """
+    maps_created = []
+    with ProcessPoolExecutor(max_workers=len(configs)) as ex:
+        futures = [ex.submit(create_champlain_tiger_maps, config) for config in configs]
+        for future in as_completed(futures):
+            maps_created.extend(future.result())
+    return maps_created
+
+
+VECTOR_BODY = 'No base map - pure vector data visualization<br>{total_features} water features'
+
+CONFIGS = [
+    MapConfig(
+        input_json='docs/json/vt_champlain_tiger_hydroids.json',
+        output_html='docs/vt_champlain_tiger.html',
+        vector_output_html='docs/vt_champlain_tiger_vector.html',
+        tiles_name='vt_champlain_tiger',
+        center=(44.5, -73.2),
+        layer_name='VT Champlain Water',
+        title='VT Champlain TIGER HYDROIDs',
+        vector_title='VT Champlain TIGER - Vector Data Only',
+        badge_color='#1976d2',
+        title_width=450,
+        vector_title_width=400,
+        body=('Water features touching Champlain Islands or VT coast<br>'
+              '<b>{total_features} features</b> • <b>{total_area_sqkm:.2f} sq km</b>'),
+        vector_body=VECTOR_BODY,
+        style_js=style_js(VT_STYLE),
+        vector_style_js=style_js(VT_VECTOR_STYLE),
+    ),
+    MapConfig(
+        input_json='docs/json/ny_champlain_tiger_hydroids.json',
+        output_html='docs/ny_champlain_tiger.html',
+        vector_output_html='docs/ny_champlain_tiger_vector.html',
+        tiles_name='ny_champlain_tiger',
+        center=(44.3, -73.4),
+        layer_name='NY Champlain Water',
+        title='NY Champlain TIGER HYDROIDs',
+        vector_title='NY Champlain TIGER - Vector Data Only',
+        badge_color='#d32f2f',
+        title_width=450,
+        vector_title_width=400,
+        body=('Water features touching Lake Champlain on NY side<br>'
+              '<b>{total_features} features</b> • <b>{total_area_sqkm:.2f} sq km</b>'),
+        vector_body=VECTOR_BODY,
+        style_js=style_js(NY_STYLE),
+        vector_style_js=style_js(NY_VECTOR_STYLE),
+    ),
+]
 
 
 if __name__ == '__main__':
@@ -360,25 +467,7 @@ if __name__ == '__main__':
     print("Champlain TIGER HYDROIDs Map Generator")
     print("=" * 60)
 
-    maps_created = []
-
-    # Create VT maps
-    result = create_vt_champlain_tiger_map()
-    if result:
-        maps_created.append(result)
-
-    result = create_vt_champlain_tiger_vector_map()
-    if result:
-        maps_created.append(result)
-
-    # Create NY maps
-    result = create_ny_champlain_tiger_map()
-    if result:
-        maps_created.append(result)
-
-    result = create_ny_champlain_tiger_vector_map()
-    if result:
-        maps_created.append(result)
+    maps_created = render_configs(CONFIGS)
 
     print("\n" + "=" * 60)
     print(f"COMPLETE: Generated {len(maps_created)} map(s)")
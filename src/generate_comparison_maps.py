@@ -3,52 +3,209 @@ Generate comparison maps from multiple Vermont data sources
 Uses working URLs from Vermont Open Geodata and Census TIGER/Line
 """
 
-import folium
 import geopandas as gpd
+import hashlib
+import pandas as pd
+import orjson
+import requests
+import shapely
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 
+from generate_all_maps_v2 import WGS84, fast_geojson, keep_columns, to_wgs84, write_compressed
+from generate_champlain_tiger_maps import TEMPLATE_ENV, TILE_LAYER, build_tiles
 
-def create_vt_geodata_boundary_map(output_path: str = 'output/vt_opendata_boundary.html'):
+# Remote layers are cached here as GeoParquet, keyed by a hash of the URL
+CACHE_DIR = Path('cache')
+
+VT_BOUNDARY_URL = "https://services1.arcgis.com/BkFxaEFNwHqX3tAw/arcgis/rest/services/FS_VCGI_OPENDATA_Boundary_BNDHASH_poly_vtbnd_SP_v1/FeatureServer/0/query?where=1%3D1&outFields=*&f=geojson"
+VT_WATER_URL = "https://services1.arcgis.com/BkFxaEFNwHqX3tAw/arcgis/rest/services/FS_VCGI_OPENDATA_Water_VHDCARTO_poly_SP_v1/FeatureServer/0/query?where=1%3D1&outFields=*&f=geojson"
+AREAWATER_URL = "https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_{fips}_areawater.zip"
+
+# Douglas-Peucker tolerance in degrees (0.0005 ≈ 55 m at VT latitude,
+# sub-pixel at zoom 9)
+SIMPLIFY_TOLERANCE = 0.0005
+
+# CONUS Albers (metres) for area calculations
+EQUAL_AREA_CRS = 'EPSG:5070'
+
+# Bounding-box area (square degrees) below which a feature cannot reach
+# 0.01 sq km at Vermont latitudes (0.01 sq km ≈ 1.15e-6 deg²)
+MIN_BBOX_AREA_DEG2 = 1e-6
+
+# Layer styles, each a single Leaflet path-options object shared by every
+# feature of the layer
+VT_BOUNDARY_STYLE = {'fillColor': '#2c5f2d', 'color': '#1e4320', 'weight': 3, 'fillOpacity': 0.3}
+VT_WATER_STYLE = {'fillColor': '#4a90e2', 'color': '#2e5f8a', 'weight': 1, 'fillOpacity': 0.7}
+CENSUS_WATER_STYLE = {'fillColor': '#1e88e5', 'color': '#0d47a1', 'weight': 1, 'fillOpacity': 0.75}
+COMPARISON_WATER_STYLE = {**VT_WATER_STYLE, 'fillOpacity': 0.5}
+COMPARISON_BOUNDARY_STYLE = {'fillColor': 'transparent', 'color': '#2c5f2d', 'weight': 2, 'fillOpacity': 0}
+
+# Plain Leaflet page with one or more GeoJSON / vector-tile overlays
+COMPARISON_TEMPLATE = TEMPLATE_ENV.get_template('comparison_map.html.j2')
+
+
+def read_geojson_url(url: str) -> gpd.GeoDataFrame:
+    """
+    Read an ArcGIS FeatureServer GeoJSON query without going through GDAL
+
+    Pages are requested with resultOffset until the server stops reporting
+    exceededTransferLimit; geometries are parsed in one vectorized
+    shapely.from_geojson call.
+    """
+    features = []
+    while True:
+        response = requests.get(url, params={'resultOffset': len(features)}, timeout=300)
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+        page = payload.get('features', [])
+        features.extend(page)
+        exceeded = payload.get('exceededTransferLimit') or \
+            payload.get('properties', {}).get('exceededTransferLimit')
+        if not exceeded or not page:
+            break
+
+    geometry = shapely.from_geojson([
+        orjson.dumps(f['geometry']) if f.get('geometry') else None for f in features
+    ])
+    return gpd.GeoDataFrame(
+        [f.get('properties') or {} for f in features], geometry=geometry, crs=WGS84
+    )
+
+
+def cached_read_file(url: str, cache_dir: Path = CACHE_DIR) -> gpd.GeoDataFrame:
+    """
+    Read a remote layer, keeping a local GeoParquet copy for later runs
+
+    Args:
+        url: Any URL gpd.read_file() accepts
+        cache_dir: Directory holding <sha1 of url>.parquet files
+
+    Returns:
+        GeoDataFrame, from the cache when present, otherwise downloaded
+    """
+    path = Path(cache_dir) / f"{hashlib.sha1(url.encode()).hexdigest()}.parquet"
+    if path.exists():
+        return gpd.read_parquet(path)
+
+    # ArcGIS GeoJSON queries are parsed directly; anything else (TIGER
+    # ZIPs) goes through pyogrio and GDAL's vector API
+    if 'f=geojson' in url:
+        gdf = read_geojson_url(url)
+    else:
+        gdf = gpd.read_file(url, engine='pyogrio')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    gdf.to_parquet(path)
+    return gdf
+
+
+def read_county_water(counties: dict, max_workers: int = 4) -> list:
+    """
+    Download TIGER AREAWATER for several counties concurrently
+
+    Args:
+        counties: Mapping of county FIPS code to county name
+        max_workers: Number of simultaneous downloads
+
+    Returns:
+        List of GeoDataFrames in the same order as counties
+    """
+    def fetch(item):
+        fips, name = item
+        print(f"  Downloading {name} County water...")
+        return cached_read_file(AREAWATER_URL.format(fips=fips))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(fetch, counties.items()))
+
+
+def geojson_layer(gdf: gpd.GeoDataFrame, name: str, style: dict, tooltip: tuple = ()) -> dict:
+    """
+    Template context for an overlay embedded in the page as GeoJSON
+
+    Args:
+        gdf: Layer to draw
+        name: Label in the layer control
+        style: Leaflet path options applied to every feature
+        tooltip: (field, alias) pairs; only these columns are embedded
+    """
+    fields = [field for field, _ in tooltip]
+    features_json = orjson.dumps(fast_geojson(keep_columns(gdf, fields)))
+
+    # Escape '</' so a property value can never close the <script> tag
+    return {
+        'name': name,
+        'style': style,
+        'tooltip': list(tooltip),
+        'features_json': features_json.replace(b'</', b'<\\/').decode('utf-8'),
+    }
+
+
+def vector_tile_layer(tiles_url: str, name: str, style: dict) -> dict:
+    """
+    Template context for an overlay drawn from pre-built vector tiles
+    """
+    return {'name': name, 'style': style, 'tiles_url': tiles_url}
+
+
+def save_map(output_path: str, **context) -> Path:
+    """
+    Render COMPARISON_TEMPLATE to output_path plus pre-compressed copies
+
+    Written through write_compressed(); the embedded GeoJSON shrinks
+    roughly 4x in the .gz.
+    """
+    html = COMPARISON_TEMPLATE.render(tile_layer=TILE_LAYER, **context).encode('utf-8')
+    return write_compressed(output_path, html)
+
+
+def build_map_tiles(gdf: gpd.GeoDataFrame, name: str, output_path: str) -> str:
+    """
+    Pre-tile a layer into a tiles/ directory next to the map page
+
+    Returns:
+        Tile URL template relative to the page, or None if tippecanoe is
+        not installed (the map then embeds the GeoJSON as before)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        geojson_path = Path(tmp) / f"{name}.geojson"
+        geojson_path.write_bytes(orjson.dumps(fast_geojson(keep_columns(gdf, []))))
+        return build_tiles(str(geojson_path), name, Path(output_path).parent / 'tiles')
+
+
+def create_vt_geodata_boundary_map(output_path: str = 'output/vt_opendata_boundary.html',
+                                   tolerance: float = SIMPLIFY_TOLERANCE,
+                                   gdf: gpd.GeoDataFrame = None):
     """
     Vermont boundary from VT Open Geodata Portal
+
+    Pass gdf to reuse an already loaded boundary layer; the reprojected,
+    unsimplified frame is returned alongside the map for later maps to share
     """
     print("\n" + "=" * 60)
     print("VT Open Geodata: State Boundary")
     print("=" * 60)
 
     try:
-        print("  Downloading from geodata.vermont.gov...")
-        url = "https://services1.arcgis.com/BkFxaEFNwHqX3tAw/arcgis/rest/services/FS_VCGI_OPENDATA_Boundary_BNDHASH_poly_vtbnd_SP_v1/FeatureServer/0/query?where=1%3D1&outFields=*&f=geojson"
-
-        gdf = gpd.read_file(url)
+        if gdf is None:
+            print("  Downloading from geodata.vermont.gov...")
+            gdf = cached_read_file(VT_BOUNDARY_URL)
         print(f"  Loaded {len(gdf)} features")
 
         # Reproject to WGS84
-        if gdf.crs != 'EPSG:4326':
-            gdf = gdf.to_crs('EPSG:4326')
+        if not gdf.crs.equals(WGS84):
+            gdf = to_wgs84(gdf)
+        simplified = gdf.set_geometry(gdf.simplify(tolerance=tolerance, preserve_topology=True))
 
-        bounds = gdf.total_bounds
+        bounds = simplified.total_bounds
         center_lat = (bounds[1] + bounds[3]) / 2
         center_lon = (bounds[0] + bounds[2]) / 2
 
-        m = folium.Map(
-            location=[center_lat, center_lon],
-            zoom_start=8,
-            tiles='OpenStreetMap'
-        )
-
-        folium.GeoJson(
-            gdf,
-            name='VT Boundary',
-            style_function=lambda x: {
-                'fillColor': '#2c5f2d',
-                'color': '#1e4320',
-                'weight': 3,
-                'fillOpacity': 0.3
-            },
-            tooltip=folium.GeoJsonTooltip(fields=list(gdf.columns[:5]))
-        ).add_to(m)
+        fields = gdf.columns.drop(gdf.geometry.name)[:5]
+        layer = geojson_layer(simplified, 'VT Boundary', VT_BOUNDARY_STYLE,
+                              tooltip=[(field, field) for field in fields])
 
         title_html = '''
         <div style="position: fixed; top: 10px; left: 50px; width: 400px;
@@ -62,11 +219,9 @@ def create_vt_geodata_boundary_map(output_path: str = 'output/vt_opendata_bounda
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output = save_map(output_path, title='VT State Boundary', title_html=title_html,
+                          center=[center_lat, center_lon], zoom=8, layers=[layer])
 
         stats = {
             'features': len(gdf),
@@ -75,53 +230,47 @@ def create_vt_geodata_boundary_map(output_path: str = 'output/vt_opendata_bounda
         }
 
         print(f"✓ Saved to {output_path}")
-        return str(output), stats
+        return str(output), stats, gdf
 
     except Exception as e:
         print(f"✗ Error: {e}")
         import traceback
         traceback.print_exc()
-        return None, None
+        return None, None, None
 
 
-def create_vt_geodata_water_map(output_path: str = 'output/vt_opendata_water.html'):
+def create_vt_geodata_water_map(output_path: str = 'output/vt_opendata_water.html',
+                                tolerance: float = SIMPLIFY_TOLERANCE,
+                                gdf: gpd.GeoDataFrame = None):
     """
     Vermont water bodies from VT Open Geodata Portal
+
+    Pass gdf to reuse an already loaded VHD layer; the reprojected,
+    unsimplified frame is returned alongside the map for later maps to share
     """
     print("\n" + "=" * 60)
     print("VT Open Geodata: Water Bodies (Hydrography Polygons)")
     print("=" * 60)
 
     try:
-        print("  Downloading from geodata.vermont.gov...")
-        url = "https://services1.arcgis.com/BkFxaEFNwHqX3tAw/arcgis/rest/services/FS_VCGI_OPENDATA_Water_VHDCARTO_poly_SP_v1/FeatureServer/0/query?where=1%3D1&outFields=*&f=geojson"
-
-        gdf = gpd.read_file(url)
+        if gdf is None:
+            print("  Downloading from geodata.vermont.gov...")
+            gdf = cached_read_file(VT_WATER_URL)
         print(f"  Loaded {len(gdf)} water features")
 
-        if gdf.crs != 'EPSG:4326':
-            gdf = gdf.to_crs('EPSG:4326')
+        if not gdf.crs.equals(WGS84):
+            gdf = to_wgs84(gdf)
+        simplified = gdf.set_geometry(gdf.simplify(tolerance=tolerance, preserve_topology=True))
 
-        # Center on Lake Champlain for island visibility
-        m = folium.Map(
-            location=[44.5, -73.2],
-            zoom_start=9,
-            tiles='OpenStreetMap'
-        )
-
-        folium.GeoJson(
-            gdf,
-            name='Water Bodies',
-            style_function=lambda x: {
-                'fillColor': '#4a90e2',
-                'color': '#2e5f8a',
-                'weight': 1,
-                'fillOpacity': 0.7
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['GNIS_Name', 'FType'] if 'GNIS_Name' in gdf.columns else []
-            )
-        ).add_to(m)
+        # Draw from vector tiles when tippecanoe is available, otherwise
+        # embed only the tooltip columns in the page
+        tiles_url = build_map_tiles(simplified, 'vt_opendata_water', output_path)
+        if tiles_url:
+            layer = vector_tile_layer(tiles_url, 'Water Bodies', VT_WATER_STYLE)
+        else:
+            fields = ['GNIS_Name', 'FType'] if 'GNIS_Name' in gdf.columns else []
+            layer = geojson_layer(simplified, 'Water Bodies', VT_WATER_STYLE,
+                                  tooltip=[(field, field) for field in fields])
 
         title_html = '''
         <div style="position: fixed; top: 10px; left: 50px; width: 440px;
@@ -136,29 +285,29 @@ def create_vt_geodata_water_map(output_path: str = 'output/vt_opendata_water.htm
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        # Center on Lake Champlain for island visibility
+        output = save_map(output_path, title='Vermont Rivers', title_html=title_html,
+                          center=[44.5, -73.2], zoom=9, layers=[layer])
 
         stats = {
             'features': len(gdf),
-            'bounds': gdf.total_bounds.tolist(),
+            'bounds': simplified.total_bounds.tolist(),
             'fields': list(gdf.columns)
         }
 
         print(f"✓ Saved to {output_path}")
-        return str(output), stats
+        return str(output), stats, gdf
 
     except Exception as e:
         print(f"✗ Error: {e}")
         import traceback
         traceback.print_exc()
-        return None, None
+        return None, None, None
 
 
-def create_census_water_map(output_path: str = 'output/census_water_champlain.html'):
+def create_census_water_map(output_path: str = 'output/census_water_champlain.html',
+                            tolerance: float = SIMPLIFY_TOLERANCE):
     """
     Census TIGER water for counties around Lake Champlain
     Grand Isle (50013), Chittenden (50007), Franklin (50011), Addison (50001)
@@ -176,45 +325,38 @@ def create_census_water_map(output_path: str = 'output/census_water_champlain.ht
             '50001': 'Addison'
         }
 
-        all_water = []
-
-        for fips, name in counties.items():
-            print(f"  Downloading {name} County water...")
-            url = f"https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_{fips}_areawater.zip"
-            gdf = gpd.read_file(url)
-            all_water.append(gdf)
+        all_water = read_county_water(counties)
 
         # Combine
-        water = gpd.GeoDataFrame(pd.concat(all_water, ignore_index=True))
+        # pd.concat of GeoDataFrames already yields a GeoDataFrame
+        water = pd.concat(all_water, ignore_index=True)
         print(f"  Combined: {len(water)} water features")
 
-        if water.crs != 'EPSG:4326':
-            water = water.to_crs('EPSG:4326')
+        if not water.crs.equals(WGS84):
+            water = to_wgs84(water)
 
-        # Filter to significant water
-        water['area_sqkm'] = water.geometry.area * 111 * 111
-        large_water = water[water['area_sqkm'] > 0.01].copy()
-        print(f"  Showing {len(large_water)} features > 0.01 sq km")
+        # Cheap bounding-box cut first, so only plausible features are
+        # reprojected and measured
+        b = water.bounds
+        candidates = water[(b.maxx - b.minx) * (b.maxy - b.miny) > MIN_BBOX_AREA_DEG2]
 
-        m = folium.Map(
-            location=[44.7, -73.25],
-            zoom_start=10,
-            tiles='OpenStreetMap'
+        # Filter to significant water, measured in one equal-area projection
+        area_sqkm = candidates.to_crs(EQUAL_AREA_CRS).geometry.area / 1e6
+        large_water = candidates[area_sqkm > 0.01]
+        print(f"  Showing {len(large_water)} features > 0.01 sq km")
+        large_water = large_water.set_geometry(
+            large_water.geometry.simplify(tolerance=tolerance, preserve_topology=True)
         )
 
-        folium.GeoJson(
-            large_water,
-            name='Water Areas',
-            style_function=lambda x: {
-                'fillColor': '#1e88e5',
-                'color': '#0d47a1',
-                'weight': 1,
-                'fillOpacity': 0.75
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME'] if 'FULLNAME' in large_water.columns else []
-            )
-        ).add_to(m)
+        # Draw from vector tiles when tippecanoe is available, otherwise
+        # embed only the tooltip columns in the page
+        tiles_url = build_map_tiles(large_water, 'census_water_champlain', output_path)
+        if tiles_url:
+            layer = vector_tile_layer(tiles_url, 'Water Areas', CENSUS_WATER_STYLE)
+        else:
+            fields = ['FULLNAME'] if 'FULLNAME' in large_water.columns else []
+            layer = geojson_layer(large_water, 'Water Areas', CENSUS_WATER_STYLE,
+                                  tooltip=[(field, field) for field in fields])
 
         title_html = '''
         <div style="position: fixed; top: 10px; left: 50px; width: 450px;
@@ -229,11 +371,9 @@ def create_census_water_map(output_path: str = 'output/census_water_champlain.ht
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output = save_map(output_path, title='Census TIGER: Champlain Water', title_html=title_html,
+                          center=[44.7, -73.25], zoom=10, layers=[layer])
 
         stats = {
             'features': len(large_water),
@@ -261,8 +401,6 @@ def create_vt_census_all_water_map(output_path: str = 'output/vt_census_water_al
     print("=" * 60)
 
     try:
-        import pandas as pd
-
         # All 14 Vermont counties
         counties = {
             '50001': 'Addison',
@@ -281,24 +419,19 @@ def create_vt_census_all_water_map(output_path: str = 'output/vt_census_water_al
             '50027': 'Windsor'
         }
 
-        all_water = []
-
-        for fips, name in counties.items():
-            print(f"  Downloading {name} County water...")
-            url = f"https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_{fips}_areawater.zip"
-            gdf = gpd.read_file(url)
-            all_water.append(gdf)
+        all_water = read_county_water(counties, max_workers=8)
 
         # Combine
-        water = gpd.GeoDataFrame(pd.concat(all_water, ignore_index=True))
+        # pd.concat of GeoDataFrames already yields a GeoDataFrame
+        water = pd.concat(all_water, ignore_index=True)
         print(f"  Combined: {len(water)} water features")
 
-        if water.crs != 'EPSG:4326':
-            water = water.to_crs('EPSG:4326')
+        if not water.crs.equals(WGS84):
+            water = to_wgs84(water)
 
         # Filter to significant water and calculate area
         water['area_sqkm'] = water['AWATER'] / 1_000_000  # Convert sq meters to sq km
-        large_water = water[water['area_sqkm'] > 0.01].copy()
+        large_water = water[water['area_sqkm'] > 0.01]
         print(f"  Showing {len(large_water)} features > 0.01 sq km")
 
         # Add human-readable feature type
@@ -311,34 +444,21 @@ def create_vt_census_all_water_map(output_path: str = 'output/vt_census_water_al
             'H3013': 'Braided Stream',
             'H3020': 'Canal/Ditch/Aqueduct'
         }
-        large_water['feature_type'] = large_water['MTFCC'].map(mtfcc_names).fillna('Unknown')
+        large_water = large_water.assign(
+            feature_type=large_water['MTFCC'].map(mtfcc_names).fillna('Unknown')
+        )
 
         # Center on Vermont
         bounds = large_water.total_bounds
         center_lat = (bounds[1] + bounds[3]) / 2
         center_lon = (bounds[0] + bounds[2]) / 2
 
-        m = folium.Map(
-            location=[center_lat, center_lon],
-            zoom_start=8,
-            tiles='OpenStreetMap'
-        )
-
-        folium.GeoJson(
-            large_water,
-            name='Water Areas',
-            style_function=lambda x: {
-                'fillColor': '#1e88e5',
-                'color': '#0d47a1',
-                'weight': 1,
-                'fillOpacity': 0.75
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'feature_type', 'HYDROID', 'area_sqkm'],
-                aliases=['Name:', 'Type:', 'Hydro ID:', 'Area (sq km):'],
-                localize=True
-            )
-        ).add_to(m)
+        layer = geojson_layer(large_water, 'Water Areas', CENSUS_WATER_STYLE, tooltip=[
+            ('FULLNAME', 'Name:'),
+            ('feature_type', 'Type:'),
+            ('HYDROID', 'Hydro ID:'),
+            ('area_sqkm', 'Area (sq km):'),
+        ])
 
         title_html = '''
         <div style="position: fixed; top: 10px; left: 50px; width: 450px;
@@ -352,11 +472,10 @@ def create_vt_census_all_water_map(output_path: str = 'output/vt_census_water_al
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output = save_map(output_path, title='Census TIGER: Vermont Water (All Counties)',
+                          title_html=title_html, center=[center_lat, center_lon], zoom=8,
+                          layers=[layer])
 
         stats = {
             'features': len(large_water),
@@ -384,8 +503,6 @@ def create_ny_census_all_water_map(output_path: str = 'output/ny_census_water_al
     print("=" * 60)
 
     try:
-        import pandas as pd
-
         # All 62 New York counties
         counties = {
             '36001': 'Albany', '36003': 'Allegany', '36005': 'Bronx', '36007': 'Broome',
@@ -406,24 +523,19 @@ def create_ny_census_all_water_map(output_path: str = 'output/ny_census_water_al
             '36121': 'Wyoming', '36123': 'Yates'
         }
 
-        all_water = []
-
-        for fips, name in counties.items():
-            print(f"  Downloading {name} County water...")
-            url = f"https://www2.census.gov/geo/tiger/TIGER2022/AREAWATER/tl_2022_{fips}_areawater.zip"
-            gdf = gpd.read_file(url)
-            all_water.append(gdf)
+        all_water = read_county_water(counties, max_workers=8)
 
         # Combine
-        water = gpd.GeoDataFrame(pd.concat(all_water, ignore_index=True))
+        # pd.concat of GeoDataFrames already yields a GeoDataFrame
+        water = pd.concat(all_water, ignore_index=True)
         print(f"  Combined: {len(water)} water features")
 
-        if water.crs != 'EPSG:4326':
-            water = water.to_crs('EPSG:4326')
+        if not water.crs.equals(WGS84):
+            water = to_wgs84(water)
 
         # Filter to significant water and calculate area
         water['area_sqkm'] = water['AWATER'] / 1_000_000  # Convert sq meters to sq km
-        large_water = water[water['area_sqkm'] > 0.01].copy()
+        large_water = water[water['area_sqkm'] > 0.01]
         print(f"  Showing {len(large_water)} features > 0.01 sq km")
 
         # Add human-readable feature type
@@ -436,34 +548,21 @@ def create_ny_census_all_water_map(output_path: str = 'output/ny_census_water_al
             'H3013': 'Braided Stream',
             'H3020': 'Canal/Ditch/Aqueduct'
         }
-        large_water['feature_type'] = large_water['MTFCC'].map(mtfcc_names).fillna('Unknown')
+        large_water = large_water.assign(
+            feature_type=large_water['MTFCC'].map(mtfcc_names).fillna('Unknown')
+        )
 
         # Center on New York
         bounds = large_water.total_bounds
         center_lat = (bounds[1] + bounds[3]) / 2
         center_lon = (bounds[0] + bounds[2]) / 2
 
-        m = folium.Map(
-            location=[center_lat, center_lon],
-            zoom_start=7,
-            tiles='OpenStreetMap'
-        )
-
-        folium.GeoJson(
-            large_water,
-            name='Water Areas',
-            style_function=lambda x: {
-                'fillColor': '#1e88e5',
-                'color': '#0d47a1',
-                'weight': 1,
-                'fillOpacity': 0.75
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'feature_type', 'HYDROID', 'area_sqkm'],
-                aliases=['Name:', 'Type:', 'Hydro ID:', 'Area (sq km):'],
-                localize=True
-            )
-        ).add_to(m)
+        layer = geojson_layer(large_water, 'Water Areas', CENSUS_WATER_STYLE, tooltip=[
+            ('FULLNAME', 'Name:'),
+            ('feature_type', 'Type:'),
+            ('HYDROID', 'Hydro ID:'),
+            ('area_sqkm', 'Area (sq km):'),
+        ])
 
         title_html = '''
         <div style="position: fixed; top: 10px; left: 50px; width: 450px;
@@ -477,11 +576,10 @@ def create_ny_census_all_water_map(output_path: str = 'output/ny_census_water_al
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output = save_map(output_path, title='Census TIGER: New York Water (All Counties)',
+                          title_html=title_html, center=[center_lat, center_lon], zoom=7,
+                          layers=[layer])
 
         stats = {
             'features': len(large_water),
@@ -500,58 +598,44 @@ def create_ny_census_all_water_map(output_path: str = 'output/ny_census_water_al
         return None, None
 
 
-def create_combined_comparison(output_path: str = 'output/data_comparison.html'):
+def create_combined_comparison(output_path: str = 'output/data_comparison.html',
+                               tolerance: float = SIMPLIFY_TOLERANCE,
+                               vt_water: gpd.GeoDataFrame = None,
+                               boundary: gpd.GeoDataFrame = None):
     """
     Side-by-side comparison of both data sources
+
+    vt_water and boundary may be passed in from the earlier maps; only the
+    layers not supplied are downloaded
     """
     print("\n" + "=" * 60)
     print("Creating Combined Comparison Map")
     print("=" * 60)
 
     try:
-        m = folium.Map(
-            location=[44.5, -73.2],
-            zoom_start=9,
-            tiles='OpenStreetMap'
-        )
-
-        # VT Open Data water
-        print("  Loading VT Open Geodata water...")
-        vt_url = "https://services1.arcgis.com/BkFxaEFNwHqX3tAw/arcgis/rest/services/FS_VCGI_OPENDATA_Water_VHDCARTO_poly_SP_v1/FeatureServer/0/query?where=1%3D1&outFields=*&f=geojson"
-        vt_water = gpd.read_file(vt_url)
-        if vt_water.crs != 'EPSG:4326':
-            vt_water = vt_water.to_crs('EPSG:4326')
-
-        folium.GeoJson(
-            vt_water,
-            name='VT Open Geodata Water',
-            style_function=lambda x: {
-                'fillColor': '#4a90e2',
-                'color': '#2e5f8a',
-                'weight': 1,
-                'fillOpacity': 0.5
-            }
-        ).add_to(m)
+        # VT Open Data water and boundary, fetched together if not supplied
+        if vt_water is None or boundary is None:
+            print("  Loading VT Open Geodata water and VT boundary...")
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                vt_water_future = ex.submit(cached_read_file, VT_WATER_URL) if vt_water is None else None
+                boundary_future = ex.submit(cached_read_file, VT_BOUNDARY_URL) if boundary is None else None
+                if vt_water_future:
+                    vt_water = vt_water_future.result()
+                if boundary_future:
+                    boundary = boundary_future.result()
+
+        if not vt_water.crs.equals(WGS84):
+            vt_water = to_wgs84(vt_water)
+        vt_water = vt_water.set_geometry(vt_water.simplify(tolerance=tolerance, preserve_topology=True))
+
+        water_layer = geojson_layer(vt_water, 'VT Open Geodata Water', COMPARISON_WATER_STYLE)
 
         # VT boundary for context
-        print("  Loading VT boundary...")
-        boundary_url = "https://services1.arcgis.com/BkFxaEFNwHqX3tAw/arcgis/rest/services/FS_VCGI_OPENDATA_Boundary_BNDHASH_poly_vtbnd_SP_v1/FeatureServer/0/query?where=1%3D1&outFields=*&f=geojson"
-        boundary = gpd.read_file(boundary_url)
-        if boundary.crs != 'EPSG:4326':
-            boundary = boundary.to_crs('EPSG:4326')
-
-        folium.GeoJson(
-            boundary,
-            name='VT Boundary',
-            style_function=lambda x: {
-                'fillColor': 'transparent',
-                'color': '#2c5f2d',
-                'weight': 2,
-                'fillOpacity': 0
-            }
-        ).add_to(m)
-
-        folium.LayerControl().add_to(m)
+        if not boundary.crs.equals(WGS84):
+            boundary = to_wgs84(boundary)
+        boundary = boundary.set_geometry(boundary.simplify(tolerance=tolerance, preserve_topology=True))
+
+        boundary_layer = geojson_layer(boundary, 'VT Boundary', COMPARISON_BOUNDARY_STYLE)
 
         title_html = '''
         <div style="position: fixed; top: 10px; left: 50px; width: 420px;
@@ -565,11 +649,10 @@ def create_combined_comparison(output_path: str = 'output/data_comparison.html')
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
 
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output = save_map(output_path, title='Data Source Comparison', title_html=title_html,
+                          center=[44.5, -73.2], zoom=9, layers=[water_layer, boundary_layer],
+                          layer_control=True)
 
         stats = {
             'vt_water_features': len(vt_water),
@@ -587,8 +670,6 @@ def create_combined_comparison(output_path: str = 'output/data_comparison.html')
 
 
 if __name__ == '__main__':
-    import pandas as pd
-
     print("=" * 60)
     print("Vermont Geodata Comparison Generator")
     print("Multiple data sources for visual assessment")
@@ -598,12 +679,13 @@ if __name__ == '__main__':
     maps_created = []
 
     # Generate all maps
-    result, stats = create_vt_geodata_boundary_map()
+    # The boundary and VHD water frames are reused by the comparison map
+    result, stats, boundary_gdf = create_vt_geodata_boundary_map()
     if result:
         maps_created.append(result)
         all_stats['vt_boundary'] = stats
 
-    result, stats = create_vt_geodata_water_map()
+    result, stats, vt_water_gdf = create_vt_geodata_water_map()
     if result:
         maps_created.append(result)
         all_stats['vt_water'] = stats
@@ -623,7 +705,7 @@ if __name__ == '__main__':
         maps_created.append(result)
         all_stats['ny_census_water_all'] = stats
 
-    result, stats = create_combined_comparison()
+    result, stats = create_combined_comparison(vt_water=vt_water_gdf, boundary=boundary_gdf)
     if result:
         maps_created.append(result)
         all_stats['comparison'] = stats
@@ -3,9 +3,16 @@
 Generate viewer configs for per-county road data.
 """
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
+# Configs are only read by the viewer JS, so they are written compact unless
+# PRETTY_JSON=1 asks for the indented form
+JSON_OPTIONS = orjson.OPT_INDENT_2 if os.environ.get('PRETTY_JSON') == '1' else 0
+
 # County info with approximate map centers
 COUNTIES = {
     'addison': {'name': 'Addison', 'center': [44.05, -73.15], 'zoom': 10},
@@ -24,6 +31,42 @@ COUNTIES = {
     'windsor': {'name': 'Windsor', 'center': [43.55, -72.45], 'zoom': 10},
 }
 
+# Layer style, tooltip and viewer features are the same for every county;
+# each config references these shared dicts rather than rebuilding them
+ROAD_COLOR_MAP = {
+    "S1100": "#d32f2f",  # Interstate - red
+    "S1200": "#ff9800",  # Highway - orange
+    "S1400": "#666666",  # Local - gray
+    "S1500": "#8d6e63",  # Trail - brown
+    "S1630": "#9c27b0",  # Ramp - purple
+    "S1640": "#607d8b",  # Service - blue-gray
+    "S1730": "#bdbdbd",  # Alley - light gray
+    "S1740": "#a5d6a7",  # Private - light green
+    "S1780": "#90a4ae",  # Parking - gray
+    "S1820": "#4caf50"   # Bike - green
+}
+
+ROAD_STYLE = {
+    "type": "colorMap",
+    "property": "MTFCC",
+    "colorMap": ROAD_COLOR_MAP,
+    "color": "#666666",
+    "weight": 1.5,
+    "opacity": 0.8
+}
+
+ROAD_TOOLTIP = {
+    "fields": ["FULLNAME", "MTFCC"],
+    "aliases": ["Road:", "Type:"]
+}
+
+VIEWER_FEATURES = {
+    "clickToSelect": {"enabled": False},
+    "jsonDisplay": {"enabled": False},
+    "layerControl": {"enabled": False}
+}
+
+
 def generate_county_config(county_key: str, county_info: dict) -> dict:
     """Generate a viewer config for a county's roads."""
     return {
@@ -56,37 +99,12 @@ def generate_county_config(county_key: str, county_info: dict) -> dict:
                 "name": "Local Roads",
                 "source": f"../json/roads/{county_key}_roads.json",
                 "zIndex": 1,
-                "style": {
-                    "type": "colorMap",
-                    "property": "MTFCC",
-                    "colorMap": {
-                        "S1100": "#d32f2f",  # Interstate - red
-                        "S1200": "#ff9800",  # Highway - orange
-                        "S1400": "#666666",  # Local - gray
-                        "S1500": "#8d6e63",  # Trail - brown
-                        "S1630": "#9c27b0",  # Ramp - purple
-                        "S1640": "#607d8b",  # Service - blue-gray
-                        "S1730": "#bdbdbd",  # Alley - light gray
-                        "S1740": "#a5d6a7",  # Private - light green
-                        "S1780": "#90a4ae",  # Parking - gray
-                        "S1820": "#4caf50"   # Bike - green
-                    },
-                    "color": "#666666",
-                    "weight": 1.5,
-                    "opacity": 0.8
-                },
-                "tooltip": {
-                    "fields": ["FULLNAME", "MTFCC"],
-                    "aliases": ["Road:", "Type:"]
-                }
+                "style": ROAD_STYLE,
+                "tooltip": ROAD_TOOLTIP
             }
         ],
 
-        "features": {
-            "clickToSelect": {"enabled": False},
-            "jsonDisplay": {"enabled": False},
-            "layerControl": {"enabled": False}
-        },
+        "features": VIEWER_FEATURES,
 
         "metadata": {
             "dataSources": ["US Census TIGER/Line Roads 2023"],
@@ -95,6 +113,16 @@ def generate_county_config(county_key: str, county_info: dict) -> dict:
     }
 
 
+def write_config(county_key: str, county_info: dict, output_dir: Path) -> str:
+    """Generate and write one county's config, returning its file name."""
+    config = generate_county_config(county_key, county_info)
+    output_path = output_dir / f"{county_key}_roads.json"
+
+    output_path.write_bytes(orjson.dumps(config, option=JSON_OPTIONS))
+
+    return output_path.name
+
+
 def main():
     """Generate configs for all counties."""
     output_dir = Path(__file__).parent.parent / 'docs' / 'viewer' / 'configs'
@@ -102,14 +130,11 @@ def main():
 
     print("Generating county road configs...")
 
-    for county_key, county_info in COUNTIES.items():
-        config = generate_county_config(county_key, county_info)
-        output_path = output_dir / f"{county_key}_roads.json"
-
-        with open(output_path, 'w') as f:
-            json.dump(config, f, indent=2)
-
-        print(f"  Created: {county_key}_roads.json")
+    # Each county is an independent file, so write them concurrently
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        names = ex.map(lambda item: write_config(*item, output_dir), COUNTIES.items())
+        for name in names:
+            print(f"  Created: {name}")
 
     print(f"\nGenerated {len(COUNTIES)} county road configs")
 
@@ -6,8 +6,290 @@ Combining multiple processed data sources to identify gaps and create composite
 
 import folium
 import json
+import orjson
+import os
+import pyogrio
+import shapely
+from concurrent.futures import ProcessPoolExecutor
+from folium.map import Layer
+from jinja2 import Template
 from pathlib import Path
 
+from generate_all_maps_v2 import build_key, fast_geojson, is_current, write_compressed, write_key
+from generate_champlain_tiger_maps import SIMPLIFY_TOLERANCE, VectorTileLayer, build_tiles
+
+# Newline-delimited copies of the layers streamed in by the vector-only map
+LAYERS_DIR = Path('docs/json/layers')
+
+# Decimal places kept in embedded coordinates; 1e-5 degrees is about 1 m,
+# well below a pixel at the zooms these maps open at
+COORD_PRECISION = 5
+
+# The code and static assets the towns-over-Champlain page is built from:
+# this script, the helper modules it imports and the script the page loads
+BUILD_SOURCES = [
+    __file__,
+    Path(__file__).with_name('generate_all_maps_v2.py'),
+    Path(__file__).with_name('generate_champlain_tiger_maps.py'),
+    'docs/js/mashup_map.js',
+]
+
+# Inputs of the towns-over-Champlain map; with BUILD_SOURCES they make up its
+# build key, so the page is only rebuilt when one of them changes
+WATER_INPUTS = [
+    'docs/json/champlain_big_lake.json',
+    'docs/json/champlain_rivers.json',
+    'docs/json/champlain_small_ponds.json',
+    'docs/json/ny_lake_champlain_water.json',
+]
+TOWNS_INPUT = 'docs/json/vt_towns.json'
+MASHUP_INPUTS = [*WATER_INPUTS, TOWNS_INPUT]
+
+# The towns split by split_towns() into Grand Isle County and the rest, so
+# each half is drawn as its own layer with one fixed style
+TOWNS_DIR = Path('cache/towns')
+GRAND_ISLE_TOWNS = str(TOWNS_DIR / 'vt_towns_grand_isle.json')
+OTHER_TOWNS = str(TOWNS_DIR / 'vt_towns_other.json')
+
+# Layer styles for the standard and vector-only maps
+BIG_LAKE_STYLE = {'fillColor': '#0d47a1', 'color': '#01579b', 'weight': 1, 'fillOpacity': 0.7}
+RIVERS_STYLE = {'fillColor': '#4fc3f7', 'color': '#0288d1', 'weight': 1, 'fillOpacity': 0.6}
+SMALL_PONDS_STYLE = {'fillColor': '#b3e5fc', 'color': '#4fc3f7', 'weight': 0.5, 'fillOpacity': 0.5}
+NY_WATER_STYLE = {'fillColor': '#5c6bc0', 'color': '#3949ab', 'weight': 1, 'fillOpacity': 0.7}
+BIG_LAKE_VECTOR_STYLE = {'fillColor': '#0d47a1', 'color': '#000000', 'weight': 1, 'fillOpacity': 0.8}
+RIVERS_VECTOR_STYLE = {'fillColor': '#4fc3f7', 'color': '#000000', 'weight': 1, 'fillOpacity': 0.7}
+SMALL_PONDS_VECTOR_STYLE = {'fillColor': '#b3e5fc', 'color': '#000000', 'weight': 0.5, 'fillOpacity': 0.6}
+NY_WATER_VECTOR_STYLE = {'fillColor': '#5c6bc0', 'color': '#000000', 'weight': 1, 'fillOpacity': 0.8}
+GRAND_ISLE_STYLE = {'fillColor': '#ff6b6b', 'color': '#c92a2a', 'weight': 3, 'fillOpacity': 0.3}
+TOWN_STYLE = {'fillColor': '#66bb6a', 'color': '#2c5f2d', 'weight': 2, 'fillOpacity': 0.2}
+GRAND_ISLE_VECTOR_STYLE = {'fillColor': '#ff6b6b', 'color': '#000000', 'weight': 3, 'fillOpacity': 0.4}
+TOWN_VECTOR_STYLE = {'fillColor': '#66bb6a', 'color': '#000000', 'weight': 2, 'fillOpacity': 0.3}
+
+# Tooltip (fields, aliases), shared by every layer that shows them
+WATER_TOOLTIP_FIELDS = ('FULLNAME', 'area_sqkm')
+WATER_TOOLTIP_ALIASES = ('Name:', 'Area (sq km):')
+NAME_TOOLTIP_FIELDS = ('FULLNAME',)
+NAME_TOOLTIP_ALIASES = ('Name:',)
+TOWN_TOOLTIP_FIELDS = ('NAME', 'county_name', 'land_area_sqkm', 'water_area_sqkm')
+TOWN_TOOLTIP_ALIASES = ('Town:', 'County:', 'Land Area (sq km):', 'Water Area (sq km):')
+
+# The only feature properties the tooltips and the click handler (HYDROID)
+# read; everything else is left out of the embedded GeoJSON
+KEEP_PROPERTIES = {
+    *WATER_TOOLTIP_FIELDS, *NAME_TOOLTIP_FIELDS, *TOWN_TOOLTIP_FIELDS, 'HYDROID'
+}
+
+# Page furniture shared by both maps
+BACK_BUTTON_HTML = '''
+        <a href="index.html" style="position: fixed; top: 10px; left: 10px; background: white;
+                                     padding: 10px 15px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
+                                     z-index: 9999; text-decoration: none; color: {color}; font-weight: 600;
+                                     font-size: 14px; display: flex; align-items: center; gap: 5px;">
+            <span>←</span>
+            <span>Back to Index</span>
+        </a>
+        '''
+
+VECTOR_ONLY_CSS = '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
+
+# FlatGeobuf copies of the GeoJSON inputs, rebuilt whenever an input changes
+FGB_DIR = Path('cache/fgb')
+
+
+def flatgeobuf_path(path: str) -> Path:
+    """
+    Path of the FlatGeobuf copy of a GeoJSON input, converting it if needed
+
+    The copy is (re)written with pyogrio when missing or older than the
+    input, via a per-process temporary file so parallel builders never
+    read a half-written copy.
+    """
+    fgb = FGB_DIR / f"{Path(path).stem}.fgb"
+    if not fgb.exists() or fgb.stat().st_mtime < Path(path).stat().st_mtime:
+        FGB_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = fgb.with_name(f"{fgb.stem}.{os.getpid()}.tmp.fgb")
+        pyogrio.write_dataframe(pyogrio.read_dataframe(path), tmp, driver='FlatGeobuf')
+        os.replace(tmp, fgb)
+    return fgb
+
+
+def load_simplified(path: str) -> dict:
+    """
+    Load a GeoJSON input simplified to SIMPLIFY_TOLERANCE for embedding
+
+    The input is read from its FlatGeobuf copy, whose coordinates decode as
+    flat arrays instead of being text-parsed, and only KEEP_PROPERTIES
+    columns are read. Detail below the tolerance is invisible at the zooms
+    these maps open at, so dropping it and rounding coordinates to
+    COORD_PRECISION shrinks the page and its parse/draw time in the
+    browser.
+    """
+    fgb = flatgeobuf_path(path)
+    columns = [c for c in pyogrio.read_info(fgb)['fields'] if c in KEEP_PROPERTIES]
+    gdf = pyogrio.read_dataframe(fgb, columns=columns)
+    geoms = shapely.simplify(gdf.geometry.values, SIMPLIFY_TOLERANCE, preserve_topology=True)
+    geoms = shapely.transform(geoms, lambda coords: coords.round(COORD_PRECISION))
+    return fast_geojson(gdf.set_geometry(geoms))
+
+
+class GeoJsonLinesLayer(Layer):
+    """
+    L.geoJSON layer filled from a newline-delimited GeoJSON file
+
+    The file is fetched and parsed one feature per line as it streams in,
+    so drawing starts with the first features instead of after the whole
+    document has been parsed. style_js is a JavaScript path-options object,
+    or a function of a feature's properties returning one.
+    """
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }} = L.geoJSON(null, {
+            style: (function(style) {
+                return function(feature) {
+                    return typeof style === 'function' ? style(feature.properties) : style;
+                };
+            })({{ this.style_js }})
+        });
+        fetch({{ this.url|tojson }}).then(function(response) {
+            var reader = response.body.getReader();
+            var decoder = new TextDecoder();
+            var buffer = '';
+            function pump() {
+                return reader.read().then(function(chunk) {
+                    buffer += decoder.decode(chunk.value || new Uint8Array(), {stream: !chunk.done});
+                    var lines = buffer.split('\\n');
+                    buffer = chunk.done ? '' : lines.pop();
+                    lines.forEach(function(line) {
+                        if (line) {{ this.get_name() }}.addData(JSON.parse(line));
+                    });
+                    if (!chunk.done) return pump();
+                });
+            }
+            return pump();
+        });
+        {% endmacro %}
+    """)
+
+    def __init__(self, url: str, style_js: str, name: str = None, **kwargs):
+        super().__init__(name=name, overlay=True, **kwargs)
+        self._name = 'GeoJsonLinesLayer'
+        self.url = url
+        self.style_js = style_js
+
+
+class FeatureTooltip(folium.MacroElement):
+    """
+    Sticky table tooltip bound once to its parent GeoJson layer group
+
+    Stands in for folium.GeoJsonTooltip, whose formatting function is
+    rendered into the page in full for every layer; this one reuses
+    mashupTooltip() from docs/js/mashup_map.js.
+    """
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        {{ this._parent.get_name() }}.bindTooltip(
+            mashupTooltip({{ this.fields|tojson }}, {{ this.aliases|tojson }}),
+            {sticky: true}
+        );
+        {% endmacro %}
+    """)
+
+    def __init__(self, fields: tuple, aliases: tuple):
+        super().__init__()
+        self._name = 'FeatureTooltip'
+        self.fields = fields
+        self.aliases = aliases
+
+
+def write_geojsonl(data: dict, path: Path) -> None:
+    """
+    Write a FeatureCollection's features as newline-delimited GeoJSON
+
+    Goes through write_compressed(), since both maps' builders write the
+    same layer files and the browser fetches them like the pages.
+    """
+    write_compressed(path, b''.join(orjson.dumps(feature) + b'\n' for feature in data['features']))
+
+
+def layer_path(path: str) -> Path:
+    """
+    Path of the newline-delimited copy of a GeoJSON input the pages stream in
+    """
+    return LAYERS_DIR / f"{Path(path).stem}.geojsonl"
+
+
+def add_geojsonl_layer(m: folium.Map, path: str, name: str, style_js: str) -> GeoJsonLinesLayer:
+    """
+    Add a layer streaming in the simplified features of the GeoJSON at path
+
+    The features are written to docs/json/layers/<stem>.geojsonl, a static
+    file the browser fetches and caches, instead of being inlined into the
+    page.
+    """
+    layer = layer_path(path)
+    write_geojsonl(load_simplified(path), layer)
+    return GeoJsonLinesLayer(f"json/layers/{layer.name}", style_js, name=name).add_to(m)
+
+
+def split_towns() -> None:
+    """
+    Split TOWNS_INPUT into GRAND_ISLE_TOWNS and OTHER_TOWNS if needed
+
+    The halves are (re)written when missing or older than the input, via
+    per-process temporary files so parallel builders never read a
+    half-written copy.
+    """
+    mtime = Path(TOWNS_INPUT).stat().st_mtime
+    if all(Path(p).exists() and Path(p).stat().st_mtime >= mtime for p in (GRAND_ISLE_TOWNS, OTHER_TOWNS)):
+        return
+
+    TOWNS_DIR.mkdir(parents=True, exist_ok=True)
+    towns = pyogrio.read_dataframe(TOWNS_INPUT)
+    grand_isle = towns['county_name'] == 'Grand Isle'
+    for path, part in ((GRAND_ISLE_TOWNS, towns[grand_isle]), (OTHER_TOWNS, towns[~grand_isle])):
+        tmp = Path(path).with_name(f"{Path(path).stem}.{os.getpid()}.tmp.json")
+        pyogrio.write_dataframe(part, tmp, driver='GeoJSON')
+        os.replace(tmp, path)
+
+
+def add_vector_layer(m: folium.Map, path: str, name: str, style_js: str):
+    """
+    Add a non-interactive layer, drawn from vector tiles when possible
+
+    The GeoJSON at path is pre-tiled into docs/tiles/mashup_<stem>/ with
+    tippecanoe; without tippecanoe it goes through add_geojsonl_layer.
+    """
+    tiles_url = build_tiles(path, f"mashup_{Path(path).stem}")
+    if tiles_url:
+        VectorTileLayer(tiles_url, style_js, name=name).add_to(m)
+    else:
+        add_geojsonl_layer(m, path, name, style_js)
+
+
+def save_map(m: folium.Map, output_path: str) -> Path:
+    """
+    Save m to output_path plus pre-compressed .gz (and .br) copies
+
+    Now that the layers are streamed from separate files the page is
+    small, so it is encoded once and each file is written in a single call.
+    """
+    return write_compressed(output_path, m.get_root().render().encode('utf-8'))
+
+
+def add_layers(m: folium.Map, layers: list):
+    """
+    Add (path, name, style, tooltip) layers to m, bottom layer first
+
+    tooltip is a (fields, aliases) pair for FeatureTooltip; layers without one are
+    non-interactive and go through add_vector_layer.
+    """
+    for path, name, style, tooltip in layers:
+        style_js = json.dumps({'fill': True, **style})
+        if tooltip is None:
+            add_vector_layer(m, path, name, style_js)
+        else:
+            FeatureTooltip(*tooltip).add_to(add_geojsonl_layer(m, path, name, style_js))
+
 
 def create_towns_over_champlain_map(output_path: str = 'docs/towns_over_champlain.html'):
     """
@@ -19,130 +301,42 @@ def create_towns_over_champlain_map(output_path: str = 'docs/towns_over_champlai
     print("=" * 60)
 
     try:
-        # Load VT categorized water data
-        print("  Loading VT categorized water data...")
-        with open('docs/json/champlain_big_lake.json', 'r') as f:
-            vt_big_lake = json.load(f)
-
-        with open('docs/json/champlain_rivers.json', 'r') as f:
-            vt_rivers = json.load(f)
-
-        with open('docs/json/champlain_small_ponds.json', 'r') as f:
-            vt_small_ponds = json.load(f)
-
-        # Load NY Lake Champlain water data
-        print("  Loading NY Lake Champlain water data...")
-        with open('docs/json/ny_lake_champlain_water.json', 'r') as f:
-            ny_water = json.load(f)
-
-        # Load VT towns data
-        print("  Loading VT towns data...")
-        with open('docs/json/vt_towns.json', 'r') as f:
-            vt_towns = json.load(f)
-
-        print(f"  VT Big Lake features: {vt_big_lake['metadata']['features_count']}")
-        print(f"  VT Rivers features: {vt_rivers['metadata']['features_count']}")
-        print(f"  VT Small Ponds features: {vt_small_ponds['metadata']['features_count']}")
-        print(f"  NY Lake Champlain features: {ny_water['metadata']['total_features']}")
-        print(f"  VT Towns: {vt_towns['metadata']['total_towns']}")
-
-        # Create map centered on Lake Champlain
+        # The page fetches its layers from docs/json/layers/, so they are
+        # outputs of the build too
+        key = build_key(*BUILD_SOURCES, *MASHUP_INPUTS)
+        layers = [*WATER_INPUTS, OTHER_TOWNS, GRAND_ISLE_TOWNS]
+        if is_current(key, output_path, *map(layer_path, layers)):
+            print(f"✓ Up to date: {output_path}")
+            return output_path
+
+        # Create map centered on Lake Champlain, drawing every feature onto
+        # one canvas instead of an SVG node each
         m = folium.Map(
             location=[44.5, -73.3],
             zoom_start=9,
-            tiles='OpenStreetMap'
+            tiles='OpenStreetMap',
+            prefer_canvas=True
         )
 
         # Add water layers first (bottom)
-        folium.GeoJson(
-            vt_big_lake,
-            name='VT - Lake Champlain Main Body',
-            style_function=lambda x: {
-                'fillColor': '#0d47a1',
-                'color': '#01579b',
-                'weight': 1,
-                'fillOpacity': 0.7
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'area_sqkm'],
-                aliases=['Name:', 'Area (sq km):']
-            )
-        ).add_to(m)
-
-        folium.GeoJson(
-            vt_rivers,
-            name='VT - Rivers & Streams',
-            style_function=lambda x: {
-                'fillColor': '#4fc3f7',
-                'color': '#0288d1',
-                'weight': 1,
-                'fillOpacity': 0.6
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'area_sqkm'],
-                aliases=['Name:', 'Area (sq km):']
-            )
-        ).add_to(m)
-
-        folium.GeoJson(
-            vt_small_ponds,
-            name='VT - Small Ponds & Lakes',
-            style_function=lambda x: {
-                'fillColor': '#b3e5fc',
-                'color': '#4fc3f7',
-                'weight': 0.5,
-                'fillOpacity': 0.5
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME', 'area_sqkm'],
-                aliases=['Name:', 'Area (sq km):']
-            )
-        ).add_to(m)
-
-        folium.GeoJson(
-            ny_water,
-            name='NY - Lake Champlain',
-            style_function=lambda x: {
-                'fillColor': '#5c6bc0',
-                'color': '#3949ab',
-                'weight': 1,
-                'fillOpacity': 0.7
-            },
-            tooltip=folium.GeoJsonTooltip(
-                fields=['FULLNAME'],
-                aliases=['Name:']
-            )
-        ).add_to(m)
-
-        # Add VT towns layer on top with semi-transparent fill and strong borders
+        print("  Adding layers...")
+        water_tooltip = (WATER_TOOLTIP_FIELDS, WATER_TOOLTIP_ALIASES)
+        add_layers(m, [
+            ('docs/json/champlain_big_lake.json', 'VT - Lake Champlain Main Body', BIG_LAKE_STYLE, water_tooltip),
+            ('docs/json/champlain_rivers.json', 'VT - Rivers & Streams', RIVERS_STYLE, water_tooltip),
+            ('docs/json/champlain_small_ponds.json', 'VT - Small Ponds & Lakes', SMALL_PONDS_STYLE, water_tooltip),
+            ('docs/json/ny_lake_champlain_water.json', 'NY - Lake Champlain', NY_WATER_STYLE,
+             (NAME_TOOLTIP_FIELDS, NAME_TOOLTIP_ALIASES)),
+        ])
+
+        # Add VT towns layers on top with semi-transparent fill and strong borders
         # Highlight Grand Isle County in a different color
-        def style_towns(feature):
-            county = feature['properties'].get('county_name', 'Unknown')
-            if county == 'Grand Isle':
-                return {
-                    'fillColor': '#ff6b6b',  # Red for Champlain Islands
-                    'color': '#c92a2a',
-                    'weight': 3,
-                    'fillOpacity': 0.3
-                }
-            else:
-                return {
-                    'fillColor': '#66bb6a',
-                    'color': '#2c5f2d',
-                    'weight': 2,
-                    'fillOpacity': 0.2
-                }
-
-        folium.GeoJson(
-            vt_towns,
-            name='VT Towns (Grand Isle in Red)',
-            style_function=style_towns,
-            tooltip=folium.GeoJsonTooltip(
-                fields=['NAME', 'county_name', 'land_area_sqkm', 'water_area_sqkm'],
-                aliases=['Town:', 'County:', 'Land Area (sq km):', 'Water Area (sq km):'],
-                localize=True
-            )
-        ).add_to(m)
+        split_towns()
+        town_tooltip = (TOWN_TOOLTIP_FIELDS, TOWN_TOOLTIP_ALIASES)
+        add_layers(m, [
+            (OTHER_TOWNS, 'VT Towns', TOWN_STYLE, town_tooltip),
+            (GRAND_ISLE_TOWNS, 'VT Towns - Grand Isle (Red)', GRAND_ISLE_STYLE, town_tooltip),
+        ])
 
         # Add layer control
         folium.LayerControl(position='topright', collapsed=False).add_to(m)
@@ -186,16 +380,7 @@ def create_towns_over_champlain_map(output_path: str = 'docs/towns_over_champlai
         m.get_root().html.add_child(folium.Element(title_html))
 
         # Add back button
-        back_button_html = '''
-        <a href="index.html" style="position: fixed; top: 10px; left: 10px; background: white;
-                                     padding: 10px 15px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-                                     z-index: 9999; text-decoration: none; color: #c92a2a; font-weight: 600;
-                                     font-size: 14px; display: flex; align-items: center; gap: 5px;">
-            <span>←</span>
-            <span>Back to Index</span>
-        </a>
-        '''
-        m.get_root().html.add_child(folium.Element(back_button_html))
+        m.get_root().html.add_child(folium.Element(BACK_BUTTON_HTML.format(color='#c92a2a')))
 
         # Add JSON display panel
         json_display_html = '''
@@ -235,125 +420,37 @@ def create_towns_over_champlain_map(output_path: str = 'docs/towns_over_champlai
         '''
         m.get_root().html.add_child(folium.Element(json_display_html))
 
-        # Add JavaScript for click handlers
-        click_script = '''
-        <script>
-        // Track selected features as a simple object: { "hydroid": "name" }
-        const selectedFeatures = {};
-        const featureLayerMap = new Map();
-
-        // Function to update JSON display
-        function updateJSONDisplay() {
-            const jsonOutput = document.getElementById('json-output');
-            if (Object.keys(selectedFeatures).length === 0) {
-                jsonOutput.textContent = '{}';
-            } else {
-                jsonOutput.textContent = JSON.stringify(selectedFeatures, null, 2);
-            }
-        }
-
-        // Wait for the page to fully load
-        window.addEventListener('load', function() {
-            // Find the map object - Folium creates it as a global variable
-            let mapObj = null;
-
-            // Search for the map object in window
-            for (let key in window) {
-                if (key.startsWith('map_') && window[key] instanceof L.Map) {
-                    mapObj = window[key];
-                    console.log('Found map object:', key);
-                    break;
-                }
-            }
-
-            if (!mapObj) {
-                console.error('Could not find map object!');
-                return;
-            }
-
-            // Add click handlers after a delay to ensure all layers are loaded
-            setTimeout(function() {
-                console.log('Setting up click handlers...');
-                let layerCount = 0;
-
-                mapObj.eachLayer(function(layer) {
-                // Check if this is a GeoJSON layer group
-                if (layer instanceof L.GeoJSON) {
-                    console.log('Found GeoJSON layer group');
-
-                    // Iterate through each feature layer in the group
-                    layer.eachLayer(function(featureLayer) {
-                        if (featureLayer.feature && featureLayer.feature.properties) {
-                            const props = featureLayer.feature.properties;
-                            layerCount++;
-
-                            // Store original style
-                            const originalStyle = {
-                                fillColor: featureLayer.options.fillColor,
-                                fillOpacity: featureLayer.options.fillOpacity,
-                                color: featureLayer.options.color,
-                                weight: featureLayer.options.weight
-                            };
-
-                            featureLayer.originalStyle = originalStyle;
-
-                            // Store layer reference by HYDROID if it exists
-                            if (props.HYDROID) {
-                                featureLayerMap.set(props.HYDROID, featureLayer);
-                            }
-
-                            // Add click handler
-                            featureLayer.on('click', function(e) {
-                                L.DomEvent.stopPropagation(e);
-
-                                const hydroid = props.HYDROID;
-                                const name = props.FULLNAME || props.NAME || 'Unnamed';
-
-                                // Skip if no HYDROID (probably a town layer)
-                                if (!hydroid) {
-                                    console.log('Clicked non-water feature:', name);
-                                    return;
-                                }
-
-                                console.log('Clicked water feature:', name, hydroid);
-
-                                // Check if already selected
-                                if (selectedFeatures[hydroid]) {
-                                    // Deselect - remove from object and reset color
-                                    console.log('Deselecting:', name);
-                                    delete selectedFeatures[hydroid];
-                                    featureLayer.setStyle(featureLayer.originalStyle);
-                                } else {
-                                    // Select - add to object and make pink
-                                    console.log('Selecting:', name);
-                                    featureLayer.setStyle({
-                                        fillColor: '#ff1493',  // Deep pink
-                                        fillOpacity: 0.8,
-                                        color: '#c90076',
-                                        weight: 2
-                                    });
-
-                                    selectedFeatures[hydroid] = name;
-                                }
-
-                                updateJSONDisplay();
-                            });
-                        }
-                    });
-                }
-            });
-
-            console.log('Click handlers attached to', layerCount, 'feature layers');
-            }, 1000);  // Wait 1 second after page load for all layers to be added
-        });
-        </script>
+        # Add the vector-only toggle, which replaces the separately generated
+        # vector-only page: it hides the basemap and restyles the layers
+        vector_toggle_html = '''
+        <style>
+            body.vector-only .leaflet-tile-pane { display: none; }
+            body.vector-only .leaflet-container { background: white; }
+        </style>
+        <button onclick="toggleVectorOnly()" style="position: fixed; bottom: 20px; right: 10px; z-index: 9999;
+                                                    background: white; border: 2px solid #c92a2a; border-radius: 8px;
+                                                    padding: 8px 12px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
+                                                    color: #c92a2a; font-weight: 600; cursor: pointer;">
+            Toggle vector only
+        </button>
         '''
-        m.get_root().html.add_child(folium.Element(click_script))
+        m.get_root().html.add_child(folium.Element(vector_toggle_html))
+
+        # Add tooltip and click handlers from a static script the browser can
+        # cache, rather than inlining it into the generated page. The init call
+        # is a child of the map so it renders after every layer has been added
+        m.get_root().html.add_child(folium.Element('<script src="js/mashup_map.js"></script>'))
+        click_init = folium.MacroElement()
+        click_init._template = Template(
+            '{% macro script(this, kwargs) %}'
+            'initMashupMap({{ this._parent.get_name() }});'
+            '{% endmacro %}'
+        )
+        m.add_child(click_init)
 
         # Save map
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output = save_map(m, output_path)
+        write_key(key, output)
 
         print(f"✓ Saved to {output_path}")
         return str(output)
@@ -374,100 +471,33 @@ def create_towns_over_champlain_vector_map(output_path: str = 'docs/towns_over_c
     print("=" * 60)
 
     try:
-        # Load same data sources
-        print("  Loading data sources...")
-        with open('docs/json/champlain_big_lake.json', 'r') as f:
-            vt_big_lake = json.load(f)
-        with open('docs/json/champlain_rivers.json', 'r') as f:
-            vt_rivers = json.load(f)
-        with open('docs/json/champlain_small_ponds.json', 'r') as f:
-            vt_small_ponds = json.load(f)
-        with open('docs/json/ny_lake_champlain_water.json', 'r') as f:
-            ny_water = json.load(f)
-        with open('docs/json/vt_towns.json', 'r') as f:
-            vt_towns = json.load(f)
-
         # Create map with NO tiles (vector only)
         m = folium.Map(
             location=[44.5, -73.3],
             zoom_start=9,
             tiles=None,
-            attr='Vector Data Only'
+            attr='Vector Data Only',
+            prefer_canvas=True
         )
 
         # Add white background
-        m.get_root().html.add_child(folium.Element(
-            '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
-        ))
+        m.get_root().html.add_child(folium.Element(VECTOR_ONLY_CSS))
 
         # Add water layers with black outlines
-        folium.GeoJson(
-            vt_big_lake,
-            name='VT - Lake Champlain',
-            style_function=lambda x: {
-                'fillColor': '#0d47a1',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.8
-            }
-        ).add_to(m)
-
-        folium.GeoJson(
-            vt_rivers,
-            name='VT - Rivers',
-            style_function=lambda x: {
-                'fillColor': '#4fc3f7',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.7
-            }
-        ).add_to(m)
-
-        folium.GeoJson(
-            vt_small_ponds,
-            name='VT - Ponds',
-            style_function=lambda x: {
-                'fillColor': '#b3e5fc',
-                'color': '#000000',
-                'weight': 0.5,
-                'fillOpacity': 0.6
-            }
-        ).add_to(m)
-
-        folium.GeoJson(
-            ny_water,
-            name='NY - Lake Champlain',
-            style_function=lambda x: {
-                'fillColor': '#5c6bc0',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.8
-            }
-        ).add_to(m)
+        print("  Adding layers...")
+        add_layers(m, [
+            ('docs/json/champlain_big_lake.json', 'VT - Lake Champlain', BIG_LAKE_VECTOR_STYLE, None),
+            ('docs/json/champlain_rivers.json', 'VT - Rivers', RIVERS_VECTOR_STYLE, None),
+            ('docs/json/champlain_small_ponds.json', 'VT - Ponds', SMALL_PONDS_VECTOR_STYLE, None),
+            ('docs/json/ny_lake_champlain_water.json', 'NY - Lake Champlain', NY_WATER_VECTOR_STYLE, None),
+        ])
 
         # Add VT towns on top
-        def style_towns(feature):
-            county = feature['properties'].get('county_name', 'Unknown')
-            if county == 'Grand Isle':
-                return {
-                    'fillColor': '#ff6b6b',
-                    'color': '#000000',
-                    'weight': 3,
-                    'fillOpacity': 0.4
-                }
-            else:
-                return {
-                    'fillColor': '#66bb6a',
-                    'color': '#000000',
-                    'weight': 2,
-                    'fillOpacity': 0.3
-                }
-
-        folium.GeoJson(
-            vt_towns,
-            name='VT Towns',
-            style_function=style_towns
-        ).add_to(m)
+        split_towns()
+        add_layers(m, [
+            (OTHER_TOWNS, 'VT Towns', TOWN_VECTOR_STYLE, None),
+            (GRAND_ISLE_TOWNS, 'VT Towns - Grand Isle', GRAND_ISLE_VECTOR_STYLE, None),
+        ])
 
         folium.LayerControl(position='topright', collapsed=False).add_to(m)
 
@@ -486,21 +516,10 @@ def create_towns_over_champlain_vector_map(output_path: str = 'docs/towns_over_c
         m.get_root().html.add_child(folium.Element(title_html))
 
         # Add back button
-        back_button_html = '''
-        <a href="index.html" style="position: fixed; top: 10px; left: 10px; background: white;
-                                     padding: 10px 15px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-                                     z-index: 9999; text-decoration: none; color: #000; font-weight: 600;
-                                     font-size: 14px; display: flex; align-items: center; gap: 5px;">
-            <span>←</span>
-            <span>Back to Index</span>
-        </a>
-        '''
-        m.get_root().html.add_child(folium.Element(back_button_html))
+        m.get_root().html.add_child(folium.Element(BACK_BUTTON_HTML.format(color='#000')))
 
         # Save map
-        output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
-        m.save(str(output))
+        output = save_map(m, output_path)
 
         print(f"✓ Saved to {output_path}")
         return str(output)
@@ -518,15 +537,13 @@ if __name__ == '__main__':
     print("Combining processed data sources for analysis")
     print("=" * 60)
 
-    maps_created = []
-
-    result = create_towns_over_champlain_map()
-    if result:
-        maps_created.append(result)
+    builders = [create_towns_over_champlain_map, create_towns_over_champlain_vector_map]
 
-    result = create_towns_over_champlain_vector_map()
-    if result:
-        maps_created.append(result)
+    # The maps share no state, so build them in parallel processes; each
+    # process parses its own copy of the inputs
+    with ProcessPoolExecutor(max_workers=len(builders)) as ex:
+        futures = [ex.submit(builder) for builder in builders]
+        maps_created = [result for result in (f.result() for f in futures) if result]
 
     print("\n" + "=" * 60)
     print(f"COMPLETE: Generated {len(maps_created)} mashup map(s)")
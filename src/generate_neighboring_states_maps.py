@@ -5,155 +5,174 @@ Creates both regular and vector-only versions
 """
 
 import folium
-import geopandas as gpd
+import pyogrio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+from generate_all_maps_v2 import build_key, fast_geojson, is_current, write_compressed, write_key
 
-def create_ny_maps():
-    """Generate NY boundary and water maps"""
-    print("\n" + "=" * 60)
-    print("Creating New York Maps")
-    print("=" * 60)
-
-    try:
-        # Load NY boundary
-        print("  Loading NY boundary from JSON...")
-        ny_boundary = gpd.read_file('docs/json/ny_boundary.json')
-
-        # Load NY Lake Champlain water
-        print("  Loading NY Lake Champlain water from JSON...")
-        ny_water = gpd.read_file('docs/json/ny_lake_champlain_water.json')
+# Where the state maps are written
+OUTPUT_DIR = Path('output')
 
-        bounds = ny_boundary.total_bounds
-        center_lat = (bounds[1] + bounds[3]) / 2
-        center_lon = (bounds[0] + bounds[2]) / 2
-
-        # Regular map with basemap
-        print("  Creating regular map...")
-        m = folium.Map(
-            location=[center_lat, center_lon],
-            zoom_start=7,
-            tiles='OpenStreetMap'
-        )
+# This script and the helper module it imports; with a state's inputs they
+# make up its build key
+BUILD_SOURCES = [__file__, Path(__file__).with_name('generate_all_maps_v2.py')]
 
-        folium.GeoJson(
-            ny_boundary,
-            name='NY Boundary',
-            style_function=lambda x: {
-                'fillColor': '#1a237e',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.3
-            },
-            tooltip=folium.GeoJsonTooltip(fields=['NAME'])
-        ).add_to(m)
+# Douglas-Peucker tolerance in degrees (~100 m); finer detail is sub-pixel
+# at the zoom 7 these maps open at
+SIMPLIFY_TOLERANCE = 0.001
 
-        folium.GeoJson(
-            ny_water,
-            name='Lake Champlain Water',
-            style_function=lambda x: {
-                'fillColor': '#4a90e2',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.7
-            }
-        ).add_to(m)
-
-        folium.LayerControl().add_to(m)
-
-        title_html = '''
+TITLE_HTML = '''
         <div style="position: fixed; top: 10px; left: 50px; width: 400px;
                     background-color: white; border: 2px solid #000;
                     border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">New York State</h4>
+            <h4 style="margin: 0;">{title}</h4>
             <p style="margin: 5px 0 0 0; font-size: 12px;">
-                NY state boundary and Lake Champlain counties<br>
-                Census TIGER 2022
+                {line1}<br>
+                {line2}
             </p>
         </div>
         '''
-        m.get_root().html.add_child(folium.Element(title_html))
-
-        output_path = 'output/ny_boundary.html'
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        m.save(output_path)
-        print(f"✓ Saved regular map to {output_path}")
-
-        # Vector-only map
-        print("  Creating vector-only map...")
-        m_vector = folium.Map(
-            location=[center_lat, center_lon],
-            zoom_start=7,
-            tiles=None,
-            attr='Vector Data Only'
-        )
-
-        m_vector.get_root().html.add_child(folium.Element(
-            '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
-        ))
-
-        folium.GeoJson(
-            ny_boundary,
-            name='NY Boundary',
-            style_function=lambda x: {
-                'fillColor': '#1a237e',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.3
-            }
-        ).add_to(m_vector)
 
+BOUNDARY_TOOLTIP_FIELDS = ('NAME',)
+
+VECTOR_ONLY_CSS = '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
+
+WATER_STYLE = {
+    'fillColor': '#4a90e2',
+    'color': '#000000',
+    'weight': 1,
+    'fillOpacity': 0.7
+}
+
+
+@dataclass(frozen=True, slots=True)
+class StateConfig:
+    """
+    Everything that differs between the neighboring states' map pairs
+
+    Inputs and outputs are named after the lowercased abbreviation, e.g.
+    docs/json/ny_boundary.json -> output/ny_boundary.html.
+    """
+    abbr: str
+    name: str
+    title: str
+    fill_color: str
+    description: str
+    vector_description: str
+    source: str
+    water_json: str = None
+
+
+STATES = [
+    StateConfig(
+        abbr='NY',
+        name='New York',
+        title='New York State',
+        fill_color='#1a237e',
+        description='NY state boundary and Lake Champlain counties',
+        vector_description='NY state boundary and Lake Champlain counties',
+        source='Census TIGER 2022',
+        water_json='docs/json/ny_lake_champlain_water.json',
+    ),
+    StateConfig(
+        abbr='NH',
+        name='New Hampshire',
+        title='New Hampshire',
+        fill_color='#c62828',
+        description='NH state boundary - Eastern neighbor along Connecticut River',
+        vector_description='NH state boundary',
+        source='Census TIGER 2023',
+    ),
+    StateConfig(
+        abbr='MA',
+        name='Massachusetts',
+        title='Massachusetts',
+        fill_color='#0d47a1',
+        description='MA state boundary - Southern neighbor for regional context',
+        vector_description='MA state boundary',
+        source='Census TIGER 2023',
+    ),
+]
+
+
+def add_state_layers(m: folium.Map, config: StateConfig, boundary: dict,
+                     water: dict, boundary_style: dict, tooltip: bool):
+    """Add the boundary (and Lake Champlain water, with a layer control) to m"""
+    folium.GeoJson(
+        boundary,
+        name=f'{config.abbr} Boundary',
+        style_function=lambda x, style=boundary_style: style,
+        tooltip=folium.GeoJsonTooltip(fields=BOUNDARY_TOOLTIP_FIELDS) if tooltip else None
+    ).add_to(m)
+
+    if water is not None:
         folium.GeoJson(
-            ny_water,
+            water,
             name='Lake Champlain Water',
-            style_function=lambda x: {
-                'fillColor': '#4a90e2',
-                'color': '#000000',
-                'weight': 1,
-                'fillOpacity': 0.7
-            }
-        ).add_to(m_vector)
-
-        folium.LayerControl().add_to(m_vector)
-
-        title_html_vector = '''
-        <div style="position: fixed; top: 10px; left: 50px; width: 400px;
-                    background-color: white; border: 2px solid #000;
-                    border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">New York State - Vector Data Only</h4>
-            <p style="margin: 5px 0 0 0; font-size: 12px;">
-                No base map - pure vector data<br>
-                NY state boundary and Lake Champlain counties
-            </p>
-        </div>
-        '''
-        m_vector.get_root().html.add_child(folium.Element(title_html_vector))
-
-        output_path_vector = 'output/ny_boundary_vector.html'
-        m_vector.save(output_path_vector)
-        print(f"✓ Saved vector map to {output_path_vector}")
-
-        return True
+            style_function=lambda x, style=WATER_STYLE: style
+        ).add_to(m)
 
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+        folium.LayerControl().add_to(m)
 
 
-def create_nh_maps():
-    """Generate NH boundary maps"""
+def create_state_maps(config: StateConfig) -> bool:
+    """Generate a state's boundary (and water) maps"""
     print("\n" + "=" * 60)
-    print("Creating New Hampshire Maps")
+    print(f"Creating {config.name} Maps")
     print("=" * 60)
 
     try:
-        print("  Loading NH boundary from JSON...")
-        nh_boundary = gpd.read_file('docs/json/nh_boundary.json')
-
-        bounds = nh_boundary.total_bounds
+        key = config.abbr.lower()
+        output_path = OUTPUT_DIR / f'{key}_boundary.html'
+        output_path_vector = OUTPUT_DIR / f'{key}_boundary_vector.html'
+
+        # Skip the state when neither its inputs nor the code building it
+        # have changed
+        boundary_json = f'docs/json/{key}_boundary.json'
+        inputs = [boundary_json, config.water_json] if config.water_json else [boundary_json]
+        inputs_key = build_key(*BUILD_SOURCES, *inputs)
+        if is_current(inputs_key, output_path, output_path_vector):
+            print(f"✓ Up to date: {output_path}, {output_path_vector}")
+            return True
+
+        # The map center comes from the layer extent GDAL reports, rather
+        # than an envelope walk over the decoded geometries
+        bounds = pyogrio.read_info(boundary_json, force_total_bounds=True)['total_bounds']
         center_lat = (bounds[1] + bounds[3]) / 2
         center_lon = (bounds[0] + bounds[2]) / 2
 
+        # Read through pyogrio's vectorized GDAL reader, decoding only the
+        # column the boundary tooltip shows (water has no tooltip)
+        print(f"  Loading {config.abbr} boundary from JSON...")
+        boundary = pyogrio.read_dataframe(boundary_json, columns=list(BOUNDARY_TOOLTIP_FIELDS))
+
+        water = None
+        if config.water_json:
+            print(f"  Loading {config.abbr} Lake Champlain water from JSON...")
+            water = pyogrio.read_dataframe(config.water_json, columns=[])
+
+        # Simplify once for both maps; topology is preserved so the
+        # boundary's rings and the lake's islands stay valid
+        boundary = boundary.set_geometry(boundary.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True))
+        if water is not None:
+            water = water.set_geometry(water.simplify(SIMPLIFY_TOLERANCE, preserve_topology=True))
+
+        # Convert to GeoJSON once; folium would otherwise reproject and
+        # re-serialize each GeoDataFrame separately for both maps
+        boundary = fast_geojson(boundary)
+        if water is not None:
+            water = fast_geojson(water)
+
+        # Built once and shared by both maps' style functions
+        boundary_style = {
+            'fillColor': config.fill_color,
+            'color': '#000000',
+            'weight': 2,
+            'fillOpacity': 0.3
+        }
+
         # Regular map with basemap
         print("  Creating regular map...")
         m = folium.Map(
@@ -162,34 +181,15 @@ def create_nh_maps():
             tiles='OpenStreetMap'
         )
 
-        folium.GeoJson(
-            nh_boundary,
-            name='NH Boundary',
-            style_function=lambda x: {
-                'fillColor': '#c62828',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.3
-            },
-            tooltip=folium.GeoJsonTooltip(fields=['NAME'])
-        ).add_to(m)
+        add_state_layers(m, config, boundary, water, boundary_style, tooltip=True)
 
-        title_html = '''
-        <div style="position: fixed; top: 10px; left: 50px; width: 400px;
-                    background-color: white; border: 2px solid #000;
-                    border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">New Hampshire</h4>
-            <p style="margin: 5px 0 0 0; font-size: 12px;">
-                NH state boundary - Eastern neighbor along Connecticut River<br>
-                Census TIGER 2023
-            </p>
-        </div>
-        '''
+        title_html = TITLE_HTML.format(
+            title=config.title, line1=config.description, line2=config.source
+        )
         m.get_root().html.add_child(folium.Element(title_html))
 
-        output_path = 'output/nh_boundary.html'
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        m.save(output_path)
+        # Written with .gz (and .br) siblings for static hosts to serve
+        write_compressed(output_path, m.get_root().render().encode('utf-8'))
         print(f"✓ Saved regular map to {output_path}")
 
         # Vector-only map
@@ -201,138 +201,22 @@ def create_nh_maps():
             attr='Vector Data Only'
         )
 
-        m_vector.get_root().html.add_child(folium.Element(
-            '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
-        ))
-
-        folium.GeoJson(
-            nh_boundary,
-            name='NH Boundary',
-            style_function=lambda x: {
-                'fillColor': '#c62828',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.3
-            }
-        ).add_to(m_vector)
-
-        title_html_vector = '''
-        <div style="position: fixed; top: 10px; left: 50px; width: 400px;
-                    background-color: white; border: 2px solid #000;
-                    border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">New Hampshire - Vector Data Only</h4>
-            <p style="margin: 5px 0 0 0; font-size: 12px;">
-                No base map - pure vector data<br>
-                NH state boundary
-            </p>
-        </div>
-        '''
-        m_vector.get_root().html.add_child(folium.Element(title_html_vector))
-
-        output_path_vector = 'output/nh_boundary_vector.html'
-        m_vector.save(output_path_vector)
-        print(f"✓ Saved vector map to {output_path_vector}")
-
-        return True
-
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+        m_vector.get_root().html.add_child(folium.Element(VECTOR_ONLY_CSS))
 
+        add_state_layers(m_vector, config, boundary, water, boundary_style, tooltip=False)
 
-def create_ma_maps():
-    """Generate MA boundary maps"""
-    print("\n" + "=" * 60)
-    print("Creating Massachusetts Maps")
-    print("=" * 60)
-
-    try:
-        print("  Loading MA boundary from JSON...")
-        ma_boundary = gpd.read_file('docs/json/ma_boundary.json')
-
-        bounds = ma_boundary.total_bounds
-        center_lat = (bounds[1] + bounds[3]) / 2
-        center_lon = (bounds[0] + bounds[2]) / 2
-
-        # Regular map with basemap
-        print("  Creating regular map...")
-        m = folium.Map(
-            location=[center_lat, center_lon],
-            zoom_start=7,
-            tiles='OpenStreetMap'
+        title_html_vector = TITLE_HTML.format(
+            title=f'{config.title} - Vector Data Only',
+            line1='No base map - pure vector data',
+            line2=config.vector_description
         )
-
-        folium.GeoJson(
-            ma_boundary,
-            name='MA Boundary',
-            style_function=lambda x: {
-                'fillColor': '#0d47a1',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.3
-            },
-            tooltip=folium.GeoJsonTooltip(fields=['NAME'])
-        ).add_to(m)
-
-        title_html = '''
-        <div style="position: fixed; top: 10px; left: 50px; width: 400px;
-                    background-color: white; border: 2px solid #000;
-                    border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">Massachusetts</h4>
-            <p style="margin: 5px 0 0 0; font-size: 12px;">
-                MA state boundary - Southern neighbor for regional context<br>
-                Census TIGER 2023
-            </p>
-        </div>
-        '''
-        m.get_root().html.add_child(folium.Element(title_html))
-
-        output_path = 'output/ma_boundary.html'
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        m.save(output_path)
-        print(f"✓ Saved regular map to {output_path}")
-
-        # Vector-only map
-        print("  Creating vector-only map...")
-        m_vector = folium.Map(
-            location=[center_lat, center_lon],
-            zoom_start=7,
-            tiles=None,
-            attr='Vector Data Only'
-        )
-
-        m_vector.get_root().html.add_child(folium.Element(
-            '<style>body { background-color: white; } .leaflet-container { background: white; }</style>'
-        ))
-
-        folium.GeoJson(
-            ma_boundary,
-            name='MA Boundary',
-            style_function=lambda x: {
-                'fillColor': '#0d47a1',
-                'color': '#000000',
-                'weight': 2,
-                'fillOpacity': 0.3
-            }
-        ).add_to(m_vector)
-
-        title_html_vector = '''
-        <div style="position: fixed; top: 10px; left: 50px; width: 400px;
-                    background-color: white; border: 2px solid #000;
-                    border-radius: 5px; z-index: 9999; padding: 10px;">
-            <h4 style="margin: 0;">Massachusetts - Vector Data Only</h4>
-            <p style="margin: 5px 0 0 0; font-size: 12px;">
-                No base map - pure vector data<br>
-                MA state boundary
-            </p>
-        </div>
-        '''
         m_vector.get_root().html.add_child(folium.Element(title_html_vector))
 
-        output_path_vector = 'output/ma_boundary_vector.html'
-        m_vector.save(output_path_vector)
+        write_compressed(output_path_vector, m_vector.get_root().render().encode('utf-8'))
         print(f"✓ Saved vector map to {output_path_vector}")
 
+        write_key(inputs_key, output_path)
+
         return True
 
     except Exception as e:
@@ -345,17 +229,10 @@ if __name__ == '__main__':
     print("Neighboring States Map Generator")
     print("=" * 60)
 
-    success_count = 0
-
-    if create_ny_maps():
-        success_count += 1
-
-    if create_nh_maps():
-        success_count += 1
-
-    if create_ma_maps():
-        success_count += 1
+    # The states share nothing, so build them in parallel processes
+    with ProcessPoolExecutor(max_workers=len(STATES)) as ex:
+        success_count = sum(ex.map(create_state_maps, STATES))
 
     print("\n" + "=" * 60)
-    print(f"COMPLETE: Generated maps for {success_count}/3 states")
+    print(f"COMPLETE: Generated maps for {success_count}/{len(STATES)} states")
     print("=" * 60)
@@ -6,8 +6,147 @@ Third-order transformation showing VT towns with water cutouts over combined TIG
 
 import folium
 import json
+import mmap
+import orjson
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+from generate_all_maps_v2 import use_orjson_for_folium
+from generate_champlain_tiger_maps import VectorTileLayer, build_tiles, simplify_geojson
+
+WATER_JSON = 'docs/json/champlain_tiger_hydroids_combined.json'
+TOWNS_JSON = 'docs/json/vt_towns_with_water_cutouts.json'
+
+# Douglas-Peucker tolerance in degrees (~10 m), well under a pixel at the
+# zoom 8 these maps open at
+SIMPLIFY_TOLERANCE = 0.0001
+
+# Decimal places kept in embedded coordinates; 1e-5 degrees is about 1 m
+COORD_PRECISION = 5
+
+# Town fill colors by county; towns in any other county are grey
+COUNTY_COLORS = {
+    'Addison': '#66bb6a',
+    'Bennington': '#42a5f5',
+    'Caledonia': '#ab47bc',
+    'Chittenden': '#ef5350',
+    'Essex': '#ffa726',
+    'Franklin': '#26c6da',
+    'Grand Isle': '#7e57c2',
+    'Lamoille': '#ec407a',
+    'Orange': '#5c6bc0',
+    'Orleans': '#9ccc65',
+    'Rutland': '#29b6f6',
+    'Washington': '#ff7043',
+    'Windham': '#26a69a',
+    'Windsor': '#ffd54f'
+}
+DEFAULT_COUNTY_COLOR = '#cccccc'
+
+
+def read_json(path: str) -> dict:
+    """
+    Parse a JSON file with orjson straight from a memory map
+
+    Saves the stdlib json module's slower parse and the file-sized str
+    copy that reading it in text mode makes first.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as buf:
+            return orjson.loads(buf)
+
+
+@lru_cache(maxsize=1)
+def load_layers() -> tuple:
+    """
+    Load the (water, towns) FeatureCollections, parsed once per process
+
+    Geometries are simplified to SIMPLIFY_TOLERANCE and rounded to
+    COORD_PRECISION, so both pages embed and draw fewer, shorter
+    vertices. Both generators embed the same two files, so the second
+    reuses the first's parse. The single cached entry holds just these
+    two documents; callers must treat them as read-only.
+    """
+    return (simplify_geojson(read_json(WATER_JSON), SIMPLIFY_TOLERANCE, COORD_PRECISION),
+            simplify_geojson(read_json(TOWNS_JSON), SIMPLIFY_TOLERANCE, COORD_PRECISION))
+
+
+def water_styles(fill_opacity: float) -> tuple:
+    """
+    (VT, NY) water styles: VT water in blue, NY water in red
+    """
+    return ({'fillColor': '#1976d2', 'color': '#0d47a1', 'weight': 1, 'fillOpacity': fill_opacity},
+            {'fillColor': '#d32f2f', 'color': '#b71c1c', 'weight': 1, 'fillOpacity': fill_opacity})
+
+
+def water_style_function(fill_opacity: float):
+    """
+    Style function drawing VT water in blue and NY water in red
+
+    Both styles are built once, so styling a feature is a comparison and
+    every feature shares one of the two dicts.
+    """
+    vt_style, ny_style = water_styles(fill_opacity)
+    return lambda feature: vt_style if feature['properties'].get('state') == 'VT' else ny_style
+
+
+def water_style_js(fill_opacity: float) -> str:
+    """
+    JavaScript equivalent of water_style_function for vector tiles
+    """
+    vt_style, ny_style = water_styles(fill_opacity)
+    return (f"function(p) {{ return p.state === 'VT' ? "
+            f"{json.dumps({'fill': True, **vt_style})} : {json.dumps({'fill': True, **ny_style})}; }}")
+
+
+def town_style_function(fill_opacity: float):
+    """
+    Style function filling towns by county with black borders
+
+    Towns with a water cutout get slightly thicker borders. A style is
+    built up front for every (county, cutout) pair, so styling a feature
+    is one lookup.
+    """
+    def style(color: str, has_cutout: bool) -> dict:
+        return {'fillColor': color, 'color': '#000000',
+                'weight': 2.5 if has_cutout else 1.5, 'fillOpacity': fill_opacity}
+
+    styles = {(county, has_cutout): style(color, has_cutout)
+              for county, color in COUNTY_COLORS.items() for has_cutout in (False, True)}
+    defaults = {has_cutout: style(DEFAULT_COUNTY_COLOR, has_cutout) for has_cutout in (False, True)}
+
+    def style_function(feature):
+        props = feature['properties']
+        has_cutout = bool(props.get('water_cutout_applied', False))
+        return styles.get((props.get('county_name'), has_cutout)) or defaults[has_cutout]
+
+    return style_function
+
+
+def town_style_js(fill_opacity: float) -> str:
+    """
+    JavaScript equivalent of town_style_function for vector tiles
+    """
+    return (f"function(p) {{ return {{fill: true, "
+            f"fillColor: {json.dumps(COUNTY_COLORS)}[p.county_name] || {json.dumps(DEFAULT_COUNTY_COLOR)}, "
+            f"color: '#000000', weight: p.water_cutout_applied ? 2.5 : 1.5, fillOpacity: {fill_opacity}}}; }}")
+
+
+def add_vector_layer(m: folium.Map, path: str, data: dict, name: str, style_function, style_js: str):
+    """
+    Add a non-interactive layer, drawn from vector tiles when possible
+
+    The GeoJSON at path is pre-tiled into docs/tiles/hydroids_<stem>/ with
+    tippecanoe, so the page loads only the tiles in view instead of every
+    feature; without tippecanoe data is embedded as a GeoJson layer.
+    """
+    tiles_url = build_tiles(path, f"hydroids_{Path(path).stem}")
+    if tiles_url:
+        VectorTileLayer(tiles_url, style_js, name=name).add_to(m)
+    else:
+        folium.GeoJson(data, name=name, style_function=style_function).add_to(m)
+
 
 def create_towns_over_hydroids_map(output_path: str = 'docs/towns_over_hydroids.html'):
     """
@@ -18,18 +157,14 @@ def create_towns_over_hydroids_map(output_path: str = 'docs/towns_over_hydroids.
     print("=" * 60)
 
     try:
-        # Load combined Champlain TIGER HYDROIDs (bottom layer)
-        print("  Loading combined Champlain TIGER HYDROIDs...")
-        with open('docs/json/champlain_tiger_hydroids_combined.json', 'r') as f:
-            water_data = json.load(f)
-
-        water_metadata = water_data.get('metadata', {})
+        # Embed the layers' features with orjson rather than the stdlib
+        use_orjson_for_folium()
 
-        # Load VT towns with water cutouts (top layer)
-        print("  Loading VT towns with water cutouts...")
-        with open('docs/json/vt_towns_with_water_cutouts.json', 'r') as f:
-            towns_data = json.load(f)
+        # Combined Champlain TIGER HYDROIDs (bottom layer) and VT towns with
+        # water cutouts (top layer)
+        water_data, towns_data = load_layers()
 
+        water_metadata = water_data.get('metadata', {})
         towns_metadata = towns_data.get('metadata', {})
 
         # Create map centered on Vermont/Champlain
@@ -40,27 +175,10 @@ def create_towns_over_hydroids_map(output_path: str = 'docs/towns_over_hydroids.
         )
 
         # Add combined water features first (bottom layer) - VT in blue, NY in red
-        def water_style_function(feature):
-            state = feature['properties'].get('state', 'Unknown')
-            if state == 'VT':
-                return {
-                    'fillColor': '#1976d2',
-                    'color': '#0d47a1',
-                    'weight': 1,
-                    'fillOpacity': 0.5
-                }
-            else:  # NY
-                return {
-                    'fillColor': '#d32f2f',
-                    'color': '#b71c1c',
-                    'weight': 1,
-                    'fillOpacity': 0.5
-                }
-
         folium.GeoJson(
             water_data,
             name='Champlain TIGER HYDROIDs (VT+NY)',
-            style_function=water_style_function,
+            style_function=water_style_function(fill_opacity=0.5),
             tooltip=folium.GeoJsonTooltip(
                 fields=['FULLNAME', 'state', 'HYDROID', 'area_sqkm'],
                 aliases=['Name:', 'State:', 'Hydro ID:', 'Area (sq km):'],
@@ -68,43 +186,11 @@ def create_towns_over_hydroids_map(output_path: str = 'docs/towns_over_hydroids.
             )
         ).add_to(m)
 
-        # County colors for towns
-        county_colors = {
-            'Addison': '#66bb6a',
-            'Bennington': '#42a5f5',
-            'Caledonia': '#ab47bc',
-            'Chittenden': '#ef5350',
-            'Essex': '#ffa726',
-            'Franklin': '#26c6da',
-            'Grand Isle': '#7e57c2',
-            'Lamoille': '#ec407a',
-            'Orange': '#5c6bc0',
-            'Orleans': '#9ccc65',
-            'Rutland': '#29b6f6',
-            'Washington': '#ff7043',
-            'Windham': '#26a69a',
-            'Windsor': '#ffd54f'
-        }
-
         # Add VT towns on top - all with BLACK borders (cutout and non-cutout)
-        def town_style_function(feature):
-            props = feature['properties']
-            county = props.get('county_name', 'Unknown')
-            has_cutout = props.get('water_cutout_applied', False)
-
-            # All towns use county colors with black borders
-            # Cutout towns have slightly thicker borders
-            return {
-                'fillColor': county_colors.get(county, '#cccccc'),
-                'color': '#000000',
-                'weight': 2.5 if has_cutout else 1.5,
-                'fillOpacity': 0.6
-            }
-
         folium.GeoJson(
             towns_data,
             name='VT Towns (with Water Cutouts)',
-            style_function=town_style_function,
+            style_function=town_style_function(fill_opacity=0.6),
             tooltip=folium.GeoJsonTooltip(
                 fields=['NAME', 'county_name', 'water_cutout_applied', 'new_land_area_sqkm'],
                 aliases=['Town:', 'County:', 'Water Cutout:', 'Area (sq km):'],
@@ -172,16 +258,9 @@ def create_towns_over_hydroids_vector_map(output_path: str = 'docs/towns_over_hy
     print("=" * 60)
 
     try:
-        # Load combined Champlain TIGER HYDROIDs
-        print("  Loading combined Champlain TIGER HYDROIDs...")
-        with open('docs/json/champlain_tiger_hydroids_combined.json', 'r') as f:
-            water_data = json.load(f)
-
-        # Load VT towns with water cutouts
-        print("  Loading VT towns with water cutouts...")
-        with open('docs/json/vt_towns_with_water_cutouts.json', 'r') as f:
-            towns_data = json.load(f)
+        use_orjson_for_folium()
 
+        water_data, towns_data = load_layers()
         towns_metadata = towns_data.get('metadata', {})
 
         # Create map with no tiles (vector only)
@@ -198,65 +277,12 @@ def create_towns_over_hydroids_vector_map(output_path: str = 'docs/towns_over_hy
         ))
 
         # Add water features first (bottom) - VT in blue, NY in red
-        def water_style_function(feature):
-            state = feature['properties'].get('state', 'Unknown')
-            if state == 'VT':
-                return {
-                    'fillColor': '#1976d2',
-                    'color': '#0d47a1',
-                    'weight': 1,
-                    'fillOpacity': 0.6
-                }
-            else:  # NY
-                return {
-                    'fillColor': '#d32f2f',
-                    'color': '#b71c1c',
-                    'weight': 1,
-                    'fillOpacity': 0.6
-                }
-
-        folium.GeoJson(
-            water_data,
-            name='Champlain Water',
-            style_function=water_style_function
-        ).add_to(m)
-
-        # County colors
-        county_colors = {
-            'Addison': '#66bb6a',
-            'Bennington': '#42a5f5',
-            'Caledonia': '#ab47bc',
-            'Chittenden': '#ef5350',
-            'Essex': '#ffa726',
-            'Franklin': '#26c6da',
-            'Grand Isle': '#7e57c2',
-            'Lamoille': '#ec407a',
-            'Orange': '#5c6bc0',
-            'Orleans': '#9ccc65',
-            'Rutland': '#29b6f6',
-            'Washington': '#ff7043',
-            'Windham': '#26a69a',
-            'Windsor': '#ffd54f'
-        }
+        add_vector_layer(m, WATER_JSON, water_data, 'Champlain Water',
+                         water_style_function(fill_opacity=0.6), water_style_js(fill_opacity=0.6))
 
         # Add towns on top - all with black borders
-        def town_style_function(feature):
-            props = feature['properties']
-            county = props.get('county_name', 'Unknown')
-            has_cutout = props.get('water_cutout_applied', False)
-
-            return {
-                'fillColor': county_colors.get(county, '#cccccc'),
-                'color': '#000000',
-                'weight': 2.5 if has_cutout else 1.5,
-                'fillOpacity': 0.7
-            }
-
-        folium.GeoJson(
-            towns_data,
-            name='VT Towns',
-            style_function=town_style_function
-        ).add_to(m)
+        add_vector_layer(m, TOWNS_JSON, towns_data, 'VT Towns',
+                         town_style_function(fill_opacity=0.7), town_style_js(fill_opacity=0.7))
 
         # Add title
         title_html = f'''
@@ -307,6 +333,14 @@ if __name__ == '__main__':
 
     maps_created = []
 
+    # Parse the inputs once up front; both maps are built from this copy
+    print("\nLoading combined Champlain TIGER HYDROIDs and VT towns with water cutouts...")
+    try:
+        load_layers()
+    except Exception as e:
+        print(f"✗ Error loading inputs: {e}")
+        sys.exit(1)
+
     result = create_towns_over_hydroids_map()
     if result:
         maps_created.append(result)